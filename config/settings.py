@@ -2,7 +2,7 @@
 Configuration settings for AWS Infrastructure Manager.
 """
 from typing import Optional, List, Dict, Any
-from pydantic import Field, validator
+from pydantic import AliasChoices, Field, validator
 from pydantic_settings import BaseSettings
 from pathlib import Path
 import os
@@ -77,6 +77,10 @@ class LoggingSettings(BaseSettings):
     # AWS Lambda Powertools specific settings
     sample_rate: float = Field(default=0.1, env="POWERTOOLS_LOGGER_SAMPLE_RATE")
     log_event: bool = Field(default=True, env="POWERTOOLS_LOGGER_LOG_EVENT")
+    metrics_sample_rate: float = Field(
+        default=1.0,
+        validation_alias=AliasChoices("POWERTOOLS_METRICS_SAMPLE_RATE", "LOG_METRICS_SAMPLE_RATE")
+    )
     
     @validator("level")
     def validate_log_level(cls, v):
@@ -91,6 +95,12 @@ class LoggingSettings(BaseSettings):
             raise ValueError("POWERTOOLS_LOGGER_SAMPLE_RATE must be between 0.0 and 1.0")
         return v
     
+    @validator("metrics_sample_rate")
+    def validate_metrics_sample_rate(cls, v):
+        if not 0.0 <= v <= 1.0:
+            raise ValueError("POWERTOOLS_METRICS_SAMPLE_RATE must be between 0.0 and 1.0")
+        return v
+    
     class Config:
         env_prefix = "LOG_"
 
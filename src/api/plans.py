@@ -61,8 +61,8 @@ class ChangeResponse(BaseModel):
             resource_type=change.resource_type,
             resource_id=change.resource_id,
             risk_level=change.risk_level.value,
-            current_config=change.current_config.__dict__ if change.current_config else None,
-            desired_config=change.desired_config.__dict__ if change.desired_config else None,
+            current_config=change.current_config.to_dict() if change.current_config else None,
+            desired_config=change.desired_config.to_dict() if change.desired_config else None,
             dependencies=change.dependencies
         )
 
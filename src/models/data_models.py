@@ -1,13 +1,18 @@
 """
 Core data models for AWS Infrastructure Manager
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from .enums import ResourceStatus, ChangeAction, RiskLevel, ChangePlanStatus, ApprovalStatus, UserRole
 
 
-@dataclass
+# Hot-path models are slotted where the interpreter supports it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ResourceConfig:
     """Configuration for creating or updating a resource"""
     type: str
@@ -15,8 +20,27 @@ class ResourceConfig:
     properties: Dict[str, Any]
     tags: Optional[Dict[str, str]] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the public fields without deep-copying properties/tags"""
+        return {
+            "type": self.type,
+            "name": self.name,
+            "properties": self.properties,
+            "tags": self.tags,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResourceConfig":
+        """Build a ResourceConfig from its to_dict() form"""
+        return cls(
+            type=data["type"],
+            name=data["name"],
+            properties=data["properties"],
+            tags=data.get("tags"),
+        )
+
+
+@dataclass(**_SLOTS)
 class ResourceFilter:
     """Filter criteria for resource queries"""
     resource_type: Optional[str] = None
@@ -25,14 +49,14 @@ class ResourceFilter:
     region: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResourceUpdate:
     """Updates to apply to a resource"""
     properties: Optional[Dict[str, Any]] = None
     tags: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Resource:
     """AWS resource representation"""
     id: str
@@ -48,7 +72,7 @@ class Resource:
     arn: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Change:
     """Represents a single change in a change plan"""
     action: ChangeAction
@@ -60,7 +84,7 @@ class Change:
     risk_level: RiskLevel = RiskLevel.LOW
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangeSummary:
     """Summary of changes in a change plan"""
     total_changes: int
@@ -71,7 +95,7 @@ class ChangeSummary:
     estimated_duration: Optional[int] = None  # in minutes
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChangePlan:
     """Plan for infrastructure changes"""
     id: str
@@ -85,7 +109,7 @@ class ChangePlan:
     approved_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StateMetadata:
     """Metadata for infrastructure state"""
     last_modified_by: str
@@ -93,7 +117,7 @@ class StateMetadata:
     change_plan_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class InfrastructureState:
     """Complete state of infrastructure for a project"""
     project_id: str
@@ -112,7 +136,7 @@ class StateSnapshot:
     s3_location: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectMember:
     """Member of a project with role"""
     user_id: str
@@ -145,7 +169,7 @@ class ProjectSettings:
     notification_settings: Optional[NotificationConfig] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectConfig:
     """Configuration for creating a project"""
     name: str
@@ -154,7 +178,7 @@ class ProjectConfig:
     settings: ProjectSettings
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectUpdate:
     """Updates to apply to a project"""
     name: Optional[str] = None
@@ -162,14 +186,14 @@ class ProjectUpdate:
     settings: Optional[ProjectSettings] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Project:
     """Project representation"""
     id: str
     name: str
     description: str
     owner: str
-    members: List[ProjectMember]
+    members: Sequence[ProjectMember]  # stored as a tuple, replaced on change
     settings: ProjectSettings
     created_at: datetime
     updated_at: datetime
@@ -8,7 +8,6 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from aws_lambda_powertools import Logger
 
-from .interfaces import ApprovalWorkflowService
 from ..models.data_models import (
     ChangePlan, ApprovalRequest, ApprovalWorkflowConfig, ApprovalRule
 )
@@ -18,7 +17,7 @@ from ..models.exceptions import InfrastructureException
 logger = Logger()
 
 
-class ApprovalWorkflowServiceImpl(ApprovalWorkflowService):
+class ApprovalWorkflowServiceImpl:
     """Implementation of approval workflow service"""
     
     def __init__(self, config: Optional[ApprovalWorkflowConfig] = None):
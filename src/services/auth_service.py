@@ -11,7 +11,6 @@ from config.logging import get_logger
 from src.models.data_models import User, UserCreate, UserUpdate, Token, TokenPayload, ProjectRole
 from src.models.enums import UserRole, ErrorCodes
 from src.models.exceptions import InfrastructureException
-from src.services.interfaces import AuthService
 
 logger = get_logger(__name__)
 
@@ -19,7 +18,7 @@ logger = get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
-class JWTAuthService(AuthService):
+class JWTAuthService:
     """JWT-based authentication and authorization service implementation"""
     
     def __init__(self):
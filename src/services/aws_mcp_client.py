@@ -4,6 +4,7 @@ AWS MCP Client for communicating with AWS MCP Server
 import asyncio
 import json
 import logging
+import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
@@ -41,6 +42,32 @@ class RetryConfig:
     jitter: bool = True
 
 
+@dataclass
+class ConcurrencyLimitConfig:
+    """Configuration for AIMD concurrency limiting of MCP calls"""
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 50
+    additive_increase: float = 1.0  # added to the limit per window of successful calls
+    multiplicative_decrease: float = 0.5  # limit factor applied on throttling
+
+
+# Error markers returned by AWS (via the MCP server) when requests are throttled
+THROTTLING_ERROR_MARKERS = (
+    "Throttling",
+    "RequestLimitExceeded",
+    "TooManyRequests",
+    "Too Many Requests",
+    "SlowDown",
+)
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Check if an error signals AWS request throttling"""
+    message = str(error)
+    return any(marker in message for marker in THROTTLING_ERROR_MARKERS)
+
+
 @dataclass
 class MCPRequest:
     """MCP protocol request structure"""
@@ -142,7 +169,10 @@ class RetryHandler:
                     self.logger.error(f"All retry attempts failed: {e}")
                     break
                 
-                delay = self._calculate_delay(attempt)
+                if is_throttling_error(e):
+                    delay = self._calculate_throttling_delay(attempt)
+                else:
+                    delay = self._calculate_delay(attempt)
                 self.logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s")
                 await asyncio.sleep(delay)
         
@@ -154,10 +184,79 @@ class RetryHandler:
         delay = min(delay, self.config.max_delay)
         
         if self.config.jitter:
-            import random
             delay *= (0.5 + random.random() * 0.5)  # Add 0-50% jitter
         
         return delay
+    
+    def _calculate_throttling_delay(self, attempt: int) -> float:
+        """Calculate full-jitter delay after a throttling error
+        
+        Spreading retries over the whole backoff window keeps throttled callers
+        from retrying in lockstep.
+        """
+        delay = min(
+            self.config.base_delay * (self.config.exponential_base ** attempt),
+            self.config.max_delay
+        )
+        return random.uniform(0, delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limiter for the number of concurrent MCP calls
+    
+    The limit grows additively while calls succeed and is cut multiplicatively
+    when AWS throttles, converging on the highest sustainable concurrency.
+    """
+    
+    def __init__(self, config: ConcurrencyLimitConfig):
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        # Created on first use so it binds to the running event loop
+        self._condition: Optional[asyncio.Condition] = None
+        self.logger = logging.getLogger(__name__)
+    
+    async def call(self, func, *args, **kwargs):
+        """Execute function once a concurrency slot is available"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            # A cancelled call says nothing about AWS capacity, so its slot is
+            # released below without growing or cutting the limit
+            raise
+        except Exception as e:
+            if is_throttling_error(e):
+                self._on_throttle()
+            raise
+        else:
+            self._on_success()
+            return result
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+    
+    def _on_success(self):
+        """Additively increase the limit (by additive_increase per full window)"""
+        self.limit = min(
+            self.limit + self.config.additive_increase / self.limit,
+            float(self.config.max_limit)
+        )
+    
+    def _on_throttle(self):
+        """Multiplicatively decrease the limit"""
+        self.limit = max(
+            self.limit * self.config.multiplicative_decrease,
+            float(self.config.min_limit)
+        )
+        self.logger.warning(f"MCP calls throttled, concurrency limit reduced to {int(self.limit)}")
 
 
 class AWSMCPClient:
@@ -168,19 +267,23 @@ class AWSMCPClient:
         server_url: str = "http://localhost:8080",
         timeout: int = 30,
         circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
-        retry_config: Optional[RetryConfig] = None
+        retry_config: Optional[RetryConfig] = None,
+        concurrency_limit_config: Optional[ConcurrencyLimitConfig] = None
     ):
         self.server_url = server_url.rstrip('/')
         self.timeout = timeout
         self.logger = logging.getLogger(__name__)
         
-        # Initialize circuit breaker and retry handler
+        # Initialize circuit breaker, retry handler and concurrency limiter
         self.circuit_breaker = CircuitBreaker(
             circuit_breaker_config or CircuitBreakerConfig()
         )
         self.retry_handler = RetryHandler(
             retry_config or RetryConfig()
         )
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            concurrency_limit_config or ConcurrencyLimitConfig()
+        )
         
         # HTTP client for MCP communication
         self._client: Optional[httpx.AsyncClient] = None
@@ -247,9 +350,14 @@ class AWSMCPClient:
             )
     
     async def _execute_with_resilience(self, func, *args, **kwargs):
-        """Execute function with circuit breaker and retry logic"""
+        """Execute function with circuit breaker, retry logic and concurrency limiting
+        
+        Every attempt acquires a slot from the client's AIMD limiter, which is
+        shared by all resource operations.
+        """
         return await self.circuit_breaker.call(
             self.retry_handler.execute_with_retry,
+            self.concurrency_limiter.call,
             func, *args, **kwargs
         )
     
@@ -4,12 +4,12 @@ Change Plan Engine Implementation
 import uuid
 from datetime import datetime
 from typing import List, Dict, Set, Optional, Any, Tuple
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 import re
 
 from aws_lambda_powertools import Logger
 
-from .interfaces import ChangePlanEngine, StateManagementService
+from .interfaces import StateManagementService
 from ..models.data_models import (
     ChangePlan, Change, ChangeAction, RiskLevel, ChangeSummary, ChangePlanStatus,
     InfrastructureState, Resource, ResourceConfig, DependencyGraph,
@@ -20,7 +20,7 @@ from ..models.exceptions import InfrastructureException, ErrorCodes
 logger = Logger(service="ChangePlanEngine")
 
 
-class DefaultChangePlanEngine(ChangePlanEngine):
+class DefaultChangePlanEngine:
     """Default implementation of change plan engine"""
     
     def __init__(self, state_service: StateManagementService):
@@ -115,11 +115,12 @@ class DefaultChangePlanEngine(ChangePlanEngine):
                 change.risk_level = self._assess_change_risk(change)
             
             # Create summary
+            action_counts = Counter(c.action for c in sorted_changes)
             summary = ChangeSummary(
                 total_changes=len(sorted_changes),
-                creates=len([c for c in sorted_changes if c.action == ChangeAction.CREATE]),
-                updates=len([c for c in sorted_changes if c.action == ChangeAction.UPDATE]),
-                deletes=len([c for c in sorted_changes if c.action == ChangeAction.DELETE])
+                creates=action_counts[ChangeAction.CREATE],
+                updates=action_counts[ChangeAction.UPDATE],
+                deletes=action_counts[ChangeAction.DELETE]
             )
             
             # Generate change plan
@@ -1,12 +1,18 @@
 """
 Infrastructure Service Implementation for AWS Infrastructure Manager
 """
+import asyncio
+import copy
+import dataclasses
+import functools
+import inspect
 import logging
 import uuid
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from .interfaces import InfrastructureService, StateManagementService, ChangePlanEngine
+from .interfaces import StateManagementService, ChangePlanEngine
 from .aws_mcp_client import AWSMCPClient
 from ..models.data_models import (
     Resource, ResourceConfig, ResourceFilter, ResourceUpdate,
@@ -17,7 +23,59 @@ from ..models.enums import ResourceStatus, ChangeAction, ChangePlanStatus
 from ..models.exceptions import InfrastructureException, ErrorCodes
 
 
-class AWSInfrastructureService(InfrastructureService):
+T = TypeVar('T')
+
+
+def wrap_errors(
+    code: ErrorCodes,
+    message: str,
+    log_message: str
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator translating failures of a service coroutine into InfrastructureException
+    
+    InfrastructureException is re-raised untouched; any other exception is wrapped
+    with the given error code. The log template is only formatted, with the bound
+    call arguments, when an error is actually logged.
+    
+    Args:
+        code: Error code used for wrapped exceptions
+        message: Prefix of the wrapped exception message
+        log_message: Log template formatted with the call arguments, e.g. "{project_id}"
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+        
+        def log_failure(
+            self: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any], error: Exception
+        ) -> None:
+            if self.logger.isEnabledFor(logging.ERROR):
+                arguments = signature.bind(self, *args, **kwargs).arguments
+                self.logger.error(f"{log_message.format(**arguments)}: {error}")
+        
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            try:
+                return await func(self, *args, **kwargs)
+            except InfrastructureException as e:
+                log_failure(self, args, kwargs, e)
+                raise
+            except Exception as e:
+                log_failure(self, args, kwargs, e)
+                raise InfrastructureException(code, f"{message}: {str(e)}")
+        
+        return wrapper
+    
+    return decorator
+
+
+@lru_cache(maxsize=1024)
+def _project_resource_filter(project_id: str) -> ResourceFilter:
+    """Canonical filter for unfiltered project queries (shared, do not mutate)"""
+    return ResourceFilter(tags={"ProjectId": project_id})
+
+
+class AWSInfrastructureService:
     """
     Concrete implementation of InfrastructureService using AWS MCP Client
     """
@@ -33,6 +91,11 @@ class AWSInfrastructureService(InfrastructureService):
         self.change_plan_engine = change_plan_engine
         self.logger = logging.getLogger(__name__)
     
+    @wrap_errors(
+        ErrorCodes.AWS_MCP_CONNECTION_FAILED,
+        "Resource creation failed",
+        "Failed to create resource for project {project_id}"
+    )
     async def create_resource(
         self,
         project_id: str,
@@ -51,36 +114,31 @@ class AWSInfrastructureService(InfrastructureService):
         Raises:
             InfrastructureException: If resource creation fails
         """
-        try:
-            self.logger.info(f"Creating resource {resource_config.name} for project {project_id}")
-            
-            # Validate project context
-            await self._validate_project_context(project_id)
-            
-            # Add project-specific tags
-            enhanced_config = self._enhance_resource_config(project_id, resource_config)
-            
-            # Create resource via AWS MCP
-            resource = await self.aws_mcp_client.create_resource(
-                project_id=project_id,
-                resource_config=enhanced_config
-            )
-            
-            # Update project state
-            await self._update_project_state_after_create(project_id, resource)
-            
-            self.logger.info(f"Successfully created resource {resource.id} for project {project_id}")
-            return resource
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create resource for project {project_id}: {e}")
-            if isinstance(e, InfrastructureException):
-                raise
-            raise InfrastructureException(
-                ErrorCodes.AWS_MCP_CONNECTION_FAILED,
-                f"Resource creation failed: {str(e)}"
-            )
+        self.logger.info(f"Creating resource {resource_config.name} for project {project_id}")
+        
+        # Validate project context
+        await self._validate_project_context(project_id)
+        
+        # Add project-specific tags
+        enhanced_config = self._enhance_resource_config(project_id, resource_config)
+        
+        # Create resource via AWS MCP
+        resource = await self.aws_mcp_client.create_resource(
+            project_id=project_id,
+            resource_config=enhanced_config
+        )
+        
+        # Update project state
+        await self._update_project_state_after_create(project_id, resource)
+        
+        self.logger.info(f"Successfully created resource {resource.id} for project {project_id}")
+        return resource
     
+    @wrap_errors(
+        ErrorCodes.RESOURCE_NOT_FOUND,
+        "Failed to retrieve resources",
+        "Failed to get resources for project {project_id}"
+    )
     async def get_resources(
         self,
         project_id: str,
@@ -96,36 +154,31 @@ class AWSInfrastructureService(InfrastructureService):
         Returns:
             List of resources matching the criteria
         """
-        try:
-            self.logger.debug(f"Getting resources for project {project_id}")
-            
-            # Validate project context
-            await self._validate_project_context(project_id)
-            
-            # Enhance filters with project-specific context
-            enhanced_filters = self._enhance_resource_filter(project_id, filters)
-            
-            # Get resources from AWS MCP
-            resources = await self.aws_mcp_client.list_resources(
-                project_id=project_id,
-                filters=enhanced_filters
-            )
-            
-            # Filter resources to ensure project isolation
-            filtered_resources = self._filter_resources_by_project(project_id, resources)
-            
-            self.logger.debug(f"Found {len(filtered_resources)} resources for project {project_id}")
-            return filtered_resources
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get resources for project {project_id}: {e}")
-            if isinstance(e, InfrastructureException):
-                raise
-            raise InfrastructureException(
-                ErrorCodes.RESOURCE_NOT_FOUND,
-                f"Failed to retrieve resources: {str(e)}"
-            )
+        self.logger.debug(f"Getting resources for project {project_id}")
+        
+        # Validate project context
+        await self._validate_project_context(project_id)
+        
+        # Enhance filters with project-specific context
+        enhanced_filters = self._enhance_resource_filter(project_id, filters)
+        
+        # Get resources from AWS MCP
+        resources = await self.aws_mcp_client.list_resources(
+            project_id=project_id,
+            filters=enhanced_filters
+        )
+        
+        # Filter resources to ensure project isolation
+        filtered_resources = self._filter_resources_by_project(project_id, resources)
+        
+        self.logger.debug(f"Found {len(filtered_resources)} resources for project {project_id}")
+        return filtered_resources
     
+    @wrap_errors(
+        ErrorCodes.RESOURCE_NOT_FOUND,
+        "Resource update failed",
+        "Failed to update resource {resource_id} for project {project_id}"
+    )
     async def update_resource(
         self,
         project_id: str,
@@ -146,43 +199,38 @@ class AWSInfrastructureService(InfrastructureService):
         Raises:
             InfrastructureException: If resource update fails
         """
-        try:
-            self.logger.info(f"Updating resource {resource_id} for project {project_id}")
-            
-            # Validate project context and resource ownership
-            await self._validate_resource_ownership(project_id, resource_id)
-            
-            # Prepare update parameters
-            update_params = {}
-            if updates.properties:
-                update_params.update(updates.properties)
-            if updates.tags:
-                # Merge with existing project tags
-                enhanced_tags = self._enhance_resource_tags(project_id, updates.tags)
-                update_params["tags"] = enhanced_tags
-            
-            # Update resource via AWS MCP
-            resource = await self.aws_mcp_client.update_resource(
-                project_id=project_id,
-                resource_id=resource_id,
-                updates=update_params
-            )
-            
-            # Update project state
-            await self._update_project_state_after_update(project_id, resource)
-            
-            self.logger.info(f"Successfully updated resource {resource_id} for project {project_id}")
-            return resource
-            
-        except Exception as e:
-            self.logger.error(f"Failed to update resource {resource_id} for project {project_id}: {e}")
-            if isinstance(e, InfrastructureException):
-                raise
-            raise InfrastructureException(
-                ErrorCodes.RESOURCE_NOT_FOUND,
-                f"Resource update failed: {str(e)}"
-            )
+        self.logger.info(f"Updating resource {resource_id} for project {project_id}")
+        
+        # Validate project context and resource ownership
+        await self._validate_resource_ownership(project_id, resource_id)
+        
+        # Prepare update parameters
+        update_params = {}
+        if updates.properties:
+            update_params.update(updates.properties)
+        if updates.tags:
+            # Merge with existing project tags
+            enhanced_tags = self._enhance_resource_tags(project_id, updates.tags)
+            update_params["tags"] = enhanced_tags
+        
+        # Update resource via AWS MCP
+        resource = await self.aws_mcp_client.update_resource(
+            project_id=project_id,
+            resource_id=resource_id,
+            updates=update_params
+        )
+        
+        # Update project state
+        await self._update_project_state_after_update(project_id, resource)
+        
+        self.logger.info(f"Successfully updated resource {resource_id} for project {project_id}")
+        return resource
     
+    @wrap_errors(
+        ErrorCodes.RESOURCE_NOT_FOUND,
+        "Resource deletion failed",
+        "Failed to delete resource {resource_id} for project {project_id}"
+    )
     async def delete_resource(
         self,
         project_id: str,
@@ -198,46 +246,37 @@ class AWSInfrastructureService(InfrastructureService):
         Raises:
             InfrastructureException: If resource deletion fails
         """
-        try:
-            self.logger.info(f"Deleting resource {resource_id} for project {project_id}")
-            
-            # Validate project context and resource ownership
-            await self._validate_resource_ownership(project_id, resource_id)
-            
-            # Get resource details before deletion for state update
-            resource = await self.aws_mcp_client.get_resource(project_id, resource_id)
-            if not resource:
-                raise InfrastructureException(
-                    ErrorCodes.RESOURCE_NOT_FOUND,
-                    f"Resource {resource_id} not found"
-                )
-            
-            # Delete resource via AWS MCP
-            success = await self.aws_mcp_client.delete_resource(
-                project_id=project_id,
-                resource_id=resource_id
-            )
-            
-            if not success:
-                raise InfrastructureException(
-                    ErrorCodes.AWS_MCP_CONNECTION_FAILED,
-                    f"Failed to delete resource {resource_id}"
-                )
-            
-            # Update project state
-            await self._update_project_state_after_delete(project_id, resource)
-            
-            self.logger.info(f"Successfully deleted resource {resource_id} for project {project_id}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to delete resource {resource_id} for project {project_id}: {e}")
-            if isinstance(e, InfrastructureException):
-                raise
+        self.logger.info(f"Deleting resource {resource_id} for project {project_id}")
+        
+        # Validate resource ownership and load the project state concurrently;
+        # the validated resource is reused for the state update
+        resource, current_state = await asyncio.gather(
+            self._validate_resource_ownership(project_id, resource_id),
+            self._load_state_for_update(project_id)
+        )
+        
+        # Delete resource via AWS MCP
+        success = await self.aws_mcp_client.delete_resource(
+            project_id=project_id,
+            resource_id=resource_id
+        )
+        
+        if not success:
             raise InfrastructureException(
-                ErrorCodes.RESOURCE_NOT_FOUND,
-                f"Resource deletion failed: {str(e)}"
+                ErrorCodes.AWS_MCP_CONNECTION_FAILED,
+                f"Failed to delete resource {resource_id}"
             )
+        
+        # Update project state
+        await self._update_project_state_after_delete(project_id, resource, current_state)
+        
+        self.logger.info(f"Successfully deleted resource {resource_id} for project {project_id}")
     
+    @wrap_errors(
+        ErrorCodes.VALIDATION_FAILED,
+        "Change plan generation failed",
+        "Failed to generate change plan for project {project_id}"
+    )
     async def generate_change_plan(
         self,
         project_id: str,
@@ -253,33 +292,23 @@ class AWSInfrastructureService(InfrastructureService):
         Returns:
             Generated ChangePlan
         """
-        try:
-            self.logger.info(f"Generating change plan for project {project_id}")
-            
-            # Validate project context
-            await self._validate_project_context(project_id)
-            
-            # Ensure desired state is for the correct project
-            if desired_state.project_id != project_id:
-                raise InfrastructureException(
-                    ErrorCodes.VALIDATION_FAILED,
-                    f"Desired state project ID {desired_state.project_id} does not match {project_id}"
-                )
-            
-            # Use change plan engine to generate the plan
-            change_plan = await self.change_plan_engine.generate_plan(project_id, desired_state)
-            
-            self.logger.info(f"Generated change plan {change_plan.id} for project {project_id}")
-            return change_plan
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate change plan for project {project_id}: {e}")
-            if isinstance(e, InfrastructureException):
-                raise
+        self.logger.info(f"Generating change plan for project {project_id}")
+        
+        # Validate project context
+        await self._validate_project_context(project_id)
+        
+        # Ensure desired state is for the correct project
+        if desired_state.project_id != project_id:
             raise InfrastructureException(
                 ErrorCodes.VALIDATION_FAILED,
-                f"Change plan generation failed: {str(e)}"
+                f"Desired state project ID {desired_state.project_id} does not match {project_id}"
             )
+        
+        # Use change plan engine to generate the plan
+        change_plan = await self.change_plan_engine.generate_plan(project_id, desired_state)
+        
+        self.logger.info(f"Generated change plan {change_plan.id} for project {project_id}")
+        return change_plan
     
     # Private helper methods
     
@@ -291,8 +320,8 @@ class AWSInfrastructureService(InfrastructureService):
                 "Project ID is required"
             )
     
-    async def _validate_resource_ownership(self, project_id: str, resource_id: str) -> None:
-        """Validate that a resource belongs to the specified project"""
+    async def _validate_resource_ownership(self, project_id: str, resource_id: str) -> Resource:
+        """Validate that a resource belongs to the specified project and return it"""
         await self._validate_project_context(project_id)
         
         # Get the resource to verify ownership
@@ -308,6 +337,8 @@ class AWSInfrastructureService(InfrastructureService):
                 ErrorCodes.INSUFFICIENT_PERMISSIONS,
                 f"Resource {resource_id} does not belong to project {project_id}"
             )
+        
+        return resource
     
     def _enhance_resource_config(
         self,
@@ -317,12 +348,7 @@ class AWSInfrastructureService(InfrastructureService):
         """Enhance resource configuration with project-specific settings"""
         enhanced_tags = self._enhance_resource_tags(project_id, resource_config.tags or {})
         
-        return ResourceConfig(
-            type=resource_config.type,
-            name=resource_config.name,
-            properties=resource_config.properties,
-            tags=enhanced_tags
-        )
+        return dataclasses.replace(resource_config, tags=enhanced_tags)
     
     def _enhance_resource_tags(
         self,
@@ -345,19 +371,16 @@ class AWSInfrastructureService(InfrastructureService):
     ) -> ResourceFilter:
         """Enhance resource filter with project-specific context"""
         if filters is None:
-            filters = ResourceFilter()
+            return _project_resource_filter(project_id)
         
         # Ensure we only get resources for this project
         project_tags = {"ProjectId": project_id}
         if filters.tags:
             project_tags.update(filters.tags)
         
-        return ResourceFilter(
-            resource_type=filters.resource_type,
-            status=filters.status,
-            tags=project_tags,
-            region=filters.region
-        )
+        enhanced_filters = copy.copy(filters)
+        enhanced_filters.tags = project_tags
+        return enhanced_filters
     
     def _filter_resources_by_project(
         self,
@@ -426,6 +449,12 @@ class AWSInfrastructureService(InfrastructureService):
                 # Find and update the resource in state
                 for i, existing_resource in enumerate(current_state.resources):
                     if existing_resource.id == resource.id:
+                        if existing_resource == resource:
+                            # Idempotent retry, stored state is already up to date
+                            self.logger.debug(
+                                f"Resource {resource.id} unchanged, skipping state save"
+                            )
+                            return
                         current_state.resources[i] = resource
                         break
                 else:
@@ -442,15 +471,22 @@ class AWSInfrastructureService(InfrastructureService):
         except Exception as e:
             self.logger.warning(f"Failed to update state after resource update: {e}")
     
+    async def _load_state_for_update(self, project_id: str) -> Optional[InfrastructureState]:
+        """Load the current project state, returning None if it cannot be read"""
+        try:
+            return await self.state_service.get_current_state(project_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to load state for project {project_id}: {e}")
+            return None
+    
     async def _update_project_state_after_delete(
         self,
         project_id: str,
-        resource: Resource
+        resource: Resource,
+        current_state: Optional[InfrastructureState]
     ) -> None:
-        """Update project state after resource deletion"""
+        """Update project state after resource deletion using the pre-loaded state"""
         try:
-            current_state = await self.state_service.get_current_state(project_id)
-            
             if current_state:
                 # Remove the resource from state
                 current_state.resources = [
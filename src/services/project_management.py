@@ -1,9 +1,12 @@
 """
 Project Management Service Implementation
 """
+import sys
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import logging
 from ..models.data_models import (
     Project, ProjectConfig, ProjectUpdate, ProjectMember,
@@ -11,146 +14,265 @@ from ..models.data_models import (
 )
 from ..models.exceptions import ProjectNotFoundError, AccessDeniedError, InfrastructureException
 from ..models.enums import ErrorCodes
-from .interfaces import ProjectManagementService
 
 logger = logging.getLogger(__name__)
 
+# Module-level aliases for the timestamp calls made on every mutation
+_UTC = timezone.utc
+_now = datetime.now
 
-class ProjectManagementServiceImpl(ProjectManagementService):
+# Number of users whose list_projects result is memoized
+_LIST_CACHE_SIZE = 1024
+
+
+class ProjectManagementServiceImpl:
     """Implementation of project management operations"""
     
     def __init__(self):
         # In-memory storage for demo purposes
         # In production, this would use a database
         self._projects: Dict[str, Project] = {}
+        # Reverse index user_id -> project IDs (dict used as an insertion-ordered set).
+        # Entries are copy-on-write: writers publish a new dict instead of
+        # mutating one a reader may be iterating
+        self._user_index: Dict[str, Dict[str, None]] = {}
+        # Per-project member lookup project_id -> user_id -> ProjectMember
+        self._members_index: Dict[str, Dict[str, ProjectMember]] = {}
+        # Store version, bumped on every mutation, and the list_projects LRU
+        # cache user_id -> (version, projects) validated against it
+        self._version = 0
+        self._list_cache: "OrderedDict[str, Tuple[int, Tuple[Project, ...]]]" = OrderedDict()
+        # Serializes mutators of the store and indexes; readers take no lock on
+        # them and work on the references they captured
+        self._write_lock = threading.Lock()
+        # Guards the list_projects LRU cache, which readers also mutate
+        self._cache_lock = threading.Lock()
         logger.info("ProjectManagementService initialized")
     
     async def create_project(self, project_config: ProjectConfig) -> Project:
         """Create a new project"""
-        project_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
-        
-        # Create owner as first member
-        owner_member = ProjectMember(
-            user_id=project_config.owner,
-            role="owner",
-            added_at=now
-        )
-        
-        project = Project(
-            id=project_id,
-            name=project_config.name,
-            description=project_config.description,
-            owner=project_config.owner,
-            members=[owner_member],
-            settings=project_config.settings,
-            created_at=now,
-            updated_at=now
-        )
-        
-        self._projects[project_id] = project
-        return project
+        return self._create_project_sync(project_config)
     
     async def get_project(self, project_id: str) -> Project:
         """Get a project by ID"""
-        if project_id not in self._projects:
-            raise ProjectNotFoundError(f"Project {project_id} not found")
-        
-        return self._projects[project_id]
+        return self._get_project_sync(project_id)
     
     async def list_projects(self, user_id: str) -> List[Project]:
         """List projects accessible to a user"""
-        accessible_projects = []
-        
-        for project in self._projects.values():
-            # Check if user is owner or member
-            if project.owner == user_id:
-                accessible_projects.append(project)
-            elif any(member.user_id == user_id for member in project.members):
-                accessible_projects.append(project)
-        
-        return accessible_projects
+        return self._list_projects_sync(user_id)
     
     async def update_project(self, project_id: str, updates: ProjectUpdate) -> Project:
         """Update an existing project"""
-        if project_id not in self._projects:
-            raise ProjectNotFoundError(f"Project {project_id} not found")
-        
-        project = self._projects[project_id]
-        
-        # Apply updates
-        if updates.name is not None:
-            project.name = updates.name
-        if updates.description is not None:
-            project.description = updates.description
-        if updates.settings is not None:
-            project.settings = updates.settings
-        
-        project.updated_at = datetime.now(timezone.utc)
-        
-        return project
+        return self._update_project_sync(project_id, updates)
     
     async def delete_project(self, project_id: str) -> None:
         """Delete a project"""
-        if project_id not in self._projects:
-            raise ProjectNotFoundError(f"Project {project_id} not found")
-        
-        del self._projects[project_id]
+        self._delete_project_sync(project_id)
     
     async def validate_project_access(self, user_id: str, project_id: str) -> bool:
         """Validate if a user has access to a project"""
-        if project_id not in self._projects:
-            return False
-        
-        project = self._projects[project_id]
-        
-        # Check if user is owner
-        if project.owner == user_id:
-            return True
-        
-        # Check if user is a member
-        return any(member.user_id == user_id for member in project.members)
+        return self._validate_project_access_sync(user_id, project_id)
+    
+    async def validate_project_access_bulk(self, user_id: str, project_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of project IDs the user has access to"""
+        return self._validate_project_access_bulk_sync(user_id, project_ids)
     
     async def add_project_member(self, project_id: str, user_id: str, role: str) -> Project:
         """Add a member to a project"""
-        if project_id not in self._projects:
-            raise ProjectNotFoundError(f"Project {project_id} not found")
-        
-        project = self._projects[project_id]
-        
-        # Check if user is already a member
-        if any(member.user_id == user_id for member in project.members):
-            raise ValueError(f"User {user_id} is already a member of project {project_id}")
-        
-        new_member = ProjectMember(
-            user_id=user_id,
-            role=role,
-            added_at=datetime.now(timezone.utc)
-        )
-        
-        project.members.append(new_member)
-        project.updated_at = datetime.now(timezone.utc)
-        
-        return project
+        return self._add_project_member_sync(project_id, user_id, role)
     
     async def remove_project_member(self, project_id: str, user_id: str) -> Project:
         """Remove a member from a project"""
-        if project_id not in self._projects:
+        return self._remove_project_member_sync(project_id, user_id)
+    
+    # Synchronous implementations
+    #
+    # The in-memory store does no I/O, so the async interface methods delegate
+    # to these directly; bulk callers can use them without coroutine overhead.
+    
+    def _create_project_sync(self, project_config: ProjectConfig) -> Project:
+        """Create a new project (synchronous implementation)"""
+        with self._write_lock:
+            project_id = uuid.uuid4().hex
+            now = _now(_UTC)
+            # User IDs repeat across many projects; share one string object
+            owner = sys.intern(project_config.owner)
+            
+            # Create owner as first member
+            owner_member = ProjectMember(user_id=owner, role="owner", added_at=now)
+            
+            project = Project(
+                id=project_id,
+                name=project_config.name,
+                description=project_config.description,
+                owner=owner,
+                members=(owner_member,),
+                settings=project_config.settings,
+                created_at=now,
+                updated_at=now
+            )
+            
+            self._projects[project_id] = project
+            self._members_index[project_id] = {owner_member.user_id: owner_member}
+            self._add_user_index_entry(owner, project_id)
+            self._version += 1
+            return project
+    
+    def _get_project_sync(self, project_id: str) -> Project:
+        """Get a project by ID (synchronous implementation)"""
+        project = self._projects.get(project_id)
+        if project is None:
             raise ProjectNotFoundError(f"Project {project_id} not found")
         
-        project = self._projects[project_id]
-        
-        # Cannot remove owner
-        if project.owner == user_id:
-            raise ValueError("Cannot remove project owner")
+        return project
+    
+    def _list_projects_sync(self, user_id: str) -> List[Project]:
+        """List projects accessible to a user (synchronous implementation)"""
+        # Capture the version before reading so a concurrent write can only
+        # make the cached entry look stale, never fresh
+        version = self._version
+        with self._cache_lock:
+            entry = self._list_cache.get(user_id)
+            if entry is not None and entry[0] == version:
+                self._list_cache.move_to_end(user_id)
+                return list(entry[1])
         
-        # Find and remove member
-        original_count = len(project.members)
-        project.members = [m for m in project.members if m.user_id != user_id]
+        project_ids = self._user_index.get(user_id, {})
+        # A project deleted after the index entry was captured is skipped.
+        # Cached as a tuple; every caller gets its own list
+        projects = tuple(
+            project for project in map(self._projects.get, project_ids) if project is not None
+        )
         
-        if len(project.members) == original_count:
-            raise ValueError(f"User {user_id} is not a member of project {project_id}")
+        with self._cache_lock:
+            self._list_cache[user_id] = (version, projects)
+            self._list_cache.move_to_end(user_id)
+            if len(self._list_cache) > _LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+        return list(projects)
+    
+    def _update_project_sync(self, project_id: str, updates: ProjectUpdate) -> Project:
+        """Update an existing project (synchronous implementation)"""
+        with self._write_lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                raise ProjectNotFoundError(f"Project {project_id} not found")
+            
+            # Apply updates, only bumping updated_at when something actually changed
+            changed = False
+            if updates.name is not None and updates.name != project.name:
+                project.name = updates.name
+                changed = True
+            if updates.description is not None and updates.description != project.description:
+                project.description = updates.description
+                changed = True
+            if updates.settings is not None and updates.settings != project.settings:
+                project.settings = updates.settings
+                changed = True
+            
+            if changed:
+                project.updated_at = _now(_UTC)
+                self._version += 1
+            
+            return project
+    
+    def _delete_project_sync(self, project_id: str) -> None:
+        """Delete a project (synchronous implementation)"""
+        with self._write_lock:
+            project = self._projects.pop(project_id, None)
+            if project is None:
+                raise ProjectNotFoundError(f"Project {project_id} not found")
+            
+            members = self._members_index.pop(project_id, {})
+            
+            # Drop the project from the owner's and members' index entries
+            for user_id in {project.owner, *members}:
+                self._drop_user_index_entry(user_id, project_id)
+            self._version += 1
+    
+    def _validate_project_access_sync(self, user_id: str, project_id: str) -> bool:
+        """Validate if a user has access to a project (synchronous implementation)"""
+        # The owner is always indexed as a member and cannot be removed, so a
+        # single member lookup covers both the owner and member checks
+        members = self._members_index.get(project_id)
+        if members is None:
+            return False
         
-        project.updated_at = datetime.now(timezone.utc)
+        return user_id in members
+    
+    def _validate_project_access_bulk_sync(self, user_id: str, project_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of project IDs the user has access to (synchronous implementation)"""
+        user_projects = self._user_index.get(user_id)
+        if not user_projects:
+            return set()
         
-        return project
\ No newline at end of file
+        return user_projects.keys() & set(project_ids)
+    
+    def _add_project_member_sync(self, project_id: str, user_id: str, role: str) -> Project:
+        """Add a member to a project (synchronous implementation)"""
+        with self._write_lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                raise ProjectNotFoundError(f"Project {project_id} not found")
+            
+            members = self._members_index[project_id]
+            
+            # Check if user is already a member
+            if user_id in members:
+                raise ValueError(f"User {user_id} is already a member of project {project_id}")
+            
+            # Roles and user IDs repeat across member lists; share one string object
+            user_id = sys.intern(user_id)
+            now = _now(_UTC)
+            new_member = ProjectMember(user_id=user_id, role=sys.intern(role), added_at=now)
+            
+            # Members are published as a new tuple so readers holding the
+            # previous one are unaffected
+            project.members = project.members + (new_member,)
+            members[user_id] = new_member
+            project.updated_at = now
+            self._add_user_index_entry(user_id, project_id)
+            self._version += 1
+            
+            return project
+    
+    def _remove_project_member_sync(self, project_id: str, user_id: str) -> Project:
+        """Remove a member from a project (synchronous implementation)"""
+        with self._write_lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                raise ProjectNotFoundError(f"Project {project_id} not found")
+            
+            # Cannot remove owner
+            if project.owner == user_id:
+                raise ValueError("Cannot remove project owner")
+            
+            # Find and remove member
+            member = self._members_index[project_id].pop(user_id, None)
+            if member is None:
+                raise ValueError(f"User {user_id} is not a member of project {project_id}")
+            
+            project.members = tuple(m for m in project.members if m is not member)
+            
+            project.updated_at = _now(_UTC)
+            self._drop_user_index_entry(user_id, project_id)
+            self._version += 1
+            
+            return project
+    
+    def _add_user_index_entry(self, user_id: str, project_id: str) -> None:
+        """Add a project to a user's reverse index entry (copy-on-write)"""
+        user_projects = dict(self._user_index.get(user_id, {}))
+        user_projects[project_id] = None
+        self._user_index[user_id] = user_projects
+    
+    def _drop_user_index_entry(self, user_id: str, project_id: str) -> None:
+        """Remove a project from a user's reverse index entry (copy-on-write)"""
+        user_projects = self._user_index.get(user_id)
+        if user_projects is not None and project_id in user_projects:
+            if len(user_projects) == 1:
+                del self._user_index[user_id]
+            else:
+                user_projects = dict(user_projects)
+                del user_projects[project_id]
+                self._user_index[user_id] = user_projects
@@ -1,24 +1,35 @@
 """
 S3-based State Management Service Implementation
 """
-import json
+import functools
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple, TypeVar, Union
 from pathlib import Path
 import asyncio
+import gzip
+import io
 import tempfile
+import threading
 import os
 
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.loaders import Loader, create_loader
 from aws_lambda_powertools import Logger
 
-from .interfaces import StateManagementService
 from ..models.data_models import (
     InfrastructureState, StateSnapshot, StateMetadata, ChangePlan,
-    Change, ChangeAction, RiskLevel, ChangeSummary, ChangePlanStatus
+    Change, ChangeAction, RiskLevel, ChangeSummary, ChangePlanStatus,
+    Resource, ResourceConfig
 )
+from ..models.enums import ResourceStatus
 from ..models.exceptions import InfrastructureException, ErrorCodes
 # Import settings with fallback for testing
 try:
@@ -40,8 +51,162 @@ except Exception:
 
 logger = Logger(service="S3StateManagement")
 
+# Compact output; datetimes are passed through and encoded natively by orjson
+_STATE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-class S3StateManagementService(StateManagementService):
+# Bodies at or above this size are sent as concurrent multipart uploads;
+# smaller ones stay a single PUT to avoid the CreateMultipartUpload round-trip
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    multipart_chunksize=_MULTIPART_THRESHOLD,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# State and plan bodies are stored gzip-compressed; objects written before
+# compression was introduced carry no ContentEncoding and are read as-is
+_CONTENT_ENCODING = 'gzip'
+_GZIP_LEVEL = 6
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Bodies at least this large are read in chunks into a pre-sized buffer
+_STREAM_READ_THRESHOLD = 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on in-flight GET/HEAD requests issued by a single listing call
+_MAX_CONCURRENT_FETCHES = 32
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request
+_DELETE_BATCH_SIZE = 1000
+
+# Attempts at a conditional history index write before giving up, and the
+# error codes S3 returns when a concurrent writer changed the index first
+_INDEX_WRITE_ATTEMPTS = 5
+_INDEX_CONFLICT_CODES = frozenset({'PreconditionFailed', 'ConditionalRequestConflict'})
+
+# The history index keeps only the newest snapshots so each save rewrites a
+# bounded object; longer history is served by listing the history prefix
+_HISTORY_INDEX_LIMIT = 100
+
+# Resource types and property changes that raise an update's risk level
+_HIGH_RISK_TYPES = frozenset({
+    'RDS::DBInstance',
+    'EC2::Instance',
+    'Lambda::Function',
+    'ECS::Service'
+})
+_HIGH_RISK_PROPERTIES = frozenset({
+    'instanceType',
+    'dbInstanceClass',
+    'engine',
+    'engineVersion',
+    'allocatedStorage'
+})
+
+# Keys _deserialize_state requires on every resource, and the status values
+# ResourceStatus accepts; used to validate snapshots without deserializing them
+_RESOURCE_KEYS = frozenset({
+    'id', 'type', 'name', 'region', 'properties', 'tags', 'status', 'createdAt', 'updatedAt'
+})
+_RESOURCE_STATUS_VALUES = frozenset(status.value for status in ResourceStatus)
+
+# boto3 calls block, so async methods hand them to this pool instead of
+# running them on the event loop; threads are only started on demand
+_S3_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_CONCURRENT_FETCHES, thread_name_prefix="s3-state"
+)
+
+# Pool sized for the executor plus multipart threads so concurrent requests
+# reuse warm connections; adaptive retries back off on S3 throttling
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+)
+
+T = TypeVar("T")
+
+
+# Every botocore session otherwise builds its own Loader and re-reads the
+# service model JSON; sharing one keeps the parsed models cached process-wide
+_shared_loader: Optional[Loader] = None
+_shared_loader_lock = threading.Lock()
+
+
+def _get_shared_loader() -> Loader:
+    """Return the process-wide botocore data loader, creating it on first use"""
+    global _shared_loader
+    if _shared_loader is None:
+        with _shared_loader_lock:
+            if _shared_loader is None:
+                _shared_loader = create_loader()
+    return _shared_loader
+
+
+def _encode_state(state_data: Dict[str, Any]) -> bytes:
+    """Encode serialized state to UTF-8 JSON bytes ready for put_object"""
+    return orjson.dumps(state_data, default=str, option=_STATE_JSON_OPTIONS)
+
+
+def _decode_state(body: Union[bytes, bytearray]) -> Dict[str, Any]:
+    """Decode a JSON document read from S3 without an intermediate str"""
+    return orjson.loads(body)
+
+
+def _read_body(response: Dict[str, Any]) -> Union[bytes, bytearray]:
+    """Read a get_object body, inflating it if it was stored gzip-encoded"""
+    content_length = response.get('ContentLength')
+    if isinstance(content_length, int) and content_length >= _STREAM_READ_THRESHOLD:
+        # Fill a buffer sized from ContentLength chunk by chunk instead of
+        # letting read() materialize one more full-size bytes object
+        body = bytearray(content_length)
+        view = memoryview(body)
+        offset = 0
+        for chunk in response['Body'].iter_chunks(_STREAM_CHUNK_SIZE):
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        view.release()
+    else:
+        body = response['Body'].read()
+    # JSON never starts with the gzip magic, so sniffing is unambiguous and
+    # also covers copies or tools that dropped the Content-Encoding header
+    if response.get('ContentEncoding') == _CONTENT_ENCODING or body[:2] == _GZIP_MAGIC:
+        body = gzip.decompress(body)
+    return body
+
+
+def _detached_state(state: InfrastructureState) -> InfrastructureState:
+    """Copy the parts of a cached state that callers mutate before saving"""
+    return replace(state, resources=list(state.resources), metadata=replace(state.metadata))
+
+
+def _encode_index_entry(key: str, version: str, timestamp: datetime, change_description: str) -> bytes:
+    """Encode one history index line"""
+    return orjson.dumps({
+        "key": key,
+        "version": version,
+        "timestamp": timestamp,
+        "changeDescription": change_description
+    }) + b"\n"
+
+
+def _config_from_dict(data: Optional[Dict[str, Any]]) -> Optional[ResourceConfig]:
+    """Rebuild a serialized ResourceConfig, passing through missing configs"""
+    return ResourceConfig.from_dict(data) if data else None
+
+
+_fromisoformat = datetime.fromisoformat
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Accept either an ISO-8601 string or an already-parsed datetime"""
+    return value if isinstance(value, datetime) else _fromisoformat(value)
+
+
+class S3StateManagementService:
     """S3-based implementation of state management service"""
     
     def __init__(self, aws_session: Optional[boto3.Session] = None):
@@ -61,18 +226,34 @@ class S3StateManagementService(StateManagementService):
             }
             if isinstance(settings.aws.profile, str) and settings.aws.profile != '':
                 session_kwargs['profile_name'] = settings.aws.profile
-            self.session = boto3.Session(**session_kwargs)
+            botocore_session = botocore.session.get_session()
+            botocore_session.register_component('data_loader', _get_shared_loader())
+            self.session = boto3.Session(botocore_session=botocore_session, **session_kwargs)
         
-        self.s3_client = self.session.client('s3')
+        self.s3_client = self.session.client('s3', config=_S3_CLIENT_CONFIG)
         self.bucket_name = settings.aws.state_bucket
         self.bucket_prefix = settings.aws.state_bucket_prefix
+        self._s3_url_prefix = f"s3://{self.bucket_name}/"
+        
+        # project_id -> (ETag, parsed current state), revalidated with If-None-Match
+        self._state_cache: Dict[str, Tuple[str, InfrastructureState]] = {}
         
         # Note: Bucket existence will be checked when first operation is performed
     
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking boto3 call on the S3 executor and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_S3_EXECUTOR, functools.partial(func, *args, **kwargs))
+    
+    def _get_object(self, **kwargs: Any) -> Tuple[Dict[str, Any], Union[bytes, bytearray]]:
+        """Fetch an object from the state bucket and read its body (blocking)"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, **kwargs)
+        return response, _read_body(response)
+    
     async def _ensure_bucket_exists(self) -> None:
         """Ensure the S3 bucket exists, create if it doesn't"""
         try:
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            await self._run(self.s3_client.head_bucket, Bucket=self.bucket_name)
             logger.info(f"S3 bucket {self.bucket_name} exists")
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -81,9 +262,10 @@ class S3StateManagementService(StateManagementService):
                 try:
                     if settings.aws.region == 'us-east-1':
                         # us-east-1 doesn't need LocationConstraint
-                        self.s3_client.create_bucket(Bucket=self.bucket_name)
+                        await self._run(self.s3_client.create_bucket, Bucket=self.bucket_name)
                     else:
-                        self.s3_client.create_bucket(
+                        await self._run(
+                            self.s3_client.create_bucket,
                             Bucket=self.bucket_name,
                             CreateBucketConfiguration={'LocationConstraint': settings.aws.region}
                         )
@@ -129,6 +311,68 @@ class S3StateManagementService(StateManagementService):
         timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S_%f")
         return f"{self.bucket_prefix}/{project_id}/history/{timestamp_str}.json"
     
+    def _list_keys(self, prefix: str) -> List[str]:
+        """List every object key under a prefix, following pagination
+        
+        Args:
+            prefix: S3 key prefix to list
+            
+        Returns:
+            Keys in S3's lexicographic order
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        return [
+            obj['Key']
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+            for obj in page.get('Contents', ())
+        ]
+    
+    def _get_history_index_key(self, project_id: str) -> str:
+        """Generate S3 key for the history index
+        
+        The index lives outside the history/ prefix so listing snapshots
+        never picks it up.
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            S3 key path for the JSON-lines history index
+        """
+        return f"{self.bucket_prefix}/{project_id}/history-index.jsonl"
+    
+    def _put_json(self, key: str, body: bytes, metadata: Dict[str, str]) -> None:
+        """Upload a gzip-compressed JSON body, switching to multipart for large payloads
+        
+        Args:
+            key: S3 key to write
+            body: Encoded JSON bytes
+            metadata: S3 user metadata for the object
+        """
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+        if len(body) < _MULTIPART_THRESHOLD:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=body,
+                ContentType='application/json',
+                ContentEncoding=_CONTENT_ENCODING,
+                Metadata=metadata
+            )
+            return
+        
+        self.s3_client.upload_fileobj(
+            io.BytesIO(body),
+            self.bucket_name,
+            key,
+            Config=_TRANSFER_CONFIG,
+            ExtraArgs={
+                'ContentType': 'application/json',
+                'ContentEncoding': _CONTENT_ENCODING,
+                'Metadata': metadata
+            }
+        )
+    
     async def get_current_state(self, project_id: str) -> Optional[InfrastructureState]:
         """Get the current infrastructure state for a project
         
@@ -138,17 +382,29 @@ class S3StateManagementService(StateManagementService):
         Returns:
             Current infrastructure state or None if not found
         """
+        cached = self._state_cache.get(project_id)
         try:
             key = self._get_state_key(project_id)
             
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
+            request = {'Key': key}
+            if cached is not None:
+                request['IfNoneMatch'] = cached[0]
             
-            state_data = json.loads(content)
-            return self._deserialize_state(state_data)
+            response, body = await self._run(self._get_object, **request)
+            state_data = _decode_state(body)
+            state = self._deserialize_state(state_data)
+            
+            etag = response.get('ETag')
+            if etag:
+                self._state_cache[project_id] = (etag, state)
+                return _detached_state(state)
+            return state
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
+            if cached is not None and error_code in ('304', 'NotModified'):
+                return _detached_state(cached[1])
+            self._state_cache.pop(project_id, None)
             if error_code == 'NoSuchKey':
                 logger.info(f"No current state found for project {project_id}")
                 return None
@@ -159,7 +415,8 @@ class S3StateManagementService(StateManagementService):
                     f"Failed to retrieve state from S3: {e}",
                     {"project_id": project_id, "key": key}
                 )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
+            self._state_cache.pop(project_id, None)
             logger.error(f"Failed to parse state JSON: {e}")
             raise InfrastructureException(
                 ErrorCodes.STATE_FILE_CORRUPTED,
@@ -167,6 +424,7 @@ class S3StateManagementService(StateManagementService):
                 {"project_id": project_id}
             )
         except Exception as e:
+            self._state_cache.pop(project_id, None)
             logger.error(f"Unexpected error getting current state: {e}")
             raise InfrastructureException(
                 ErrorCodes.STATE_FILE_CORRUPTED,
@@ -181,31 +439,25 @@ class S3StateManagementService(StateManagementService):
             project_id: Project identifier
             state: Infrastructure state to save
         """
+        self._state_cache.pop(project_id, None)
         try:
             # First, backup current state to history if it exists
-            current_state = await self.get_current_state(project_id)
-            if current_state:
-                await self._save_to_history(project_id, current_state)
+            await self._save_to_history(project_id)
             
             # Serialize and save new state
             state_data = self._serialize_state(state)
-            state_json = json.dumps(state_data, indent=2, default=str)
+            state_body = _encode_state(state_data)
             
             key = self._get_state_key(project_id)
             
             # Save to S3 with metadata
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=state_json.encode('utf-8'),
-                ContentType='application/json',
-                Metadata={
-                    'project-id': project_id,
-                    'version': state.version,
-                    'timestamp': state.timestamp.isoformat(),
-                    'last-modified-by': state.metadata.last_modified_by
-                }
-            )
+            await self._run(self._put_json, key, state_body, {
+                'project-id': project_id,
+                'version': state.version,
+                'timestamp': state.timestamp.isoformat(),
+                'change-description': state.metadata.change_description,
+                'last-modified-by': state.metadata.last_modified_by
+            })
             
             logger.info(f"Saved state for project {project_id}, version {state.version}")
             
@@ -238,57 +490,14 @@ class S3StateManagementService(StateManagementService):
             List of historical state snapshots, sorted by timestamp (newest first)
         """
         try:
-            prefix = f"{self.bucket_prefix}/{project_id}/history/"
-            
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-            
-            snapshots = []
-            
-            if 'Contents' in response:
-                # Sort by last modified (newest first)
-                objects = sorted(
-                    response['Contents'],
-                    key=lambda x: x['LastModified'],
-                    reverse=True
-                )
-                
-                # Apply limit if specified
-                if limit:
-                    objects = objects[:limit]
-                
-                for obj in objects:
-                    # Extract timestamp from key
-                    key_parts = obj['Key'].split('/')
-                    filename = key_parts[-1].replace('.json', '')
-                    
-                    try:
-                        # Parse timestamp from filename (format: YYYYMMDD_HHMMSS_microseconds)
-                        timestamp = datetime.strptime(filename, "%Y%m%d_%H%M%S_%f")
-                        
-                        # Get metadata to extract change description
-                        head_response = self.s3_client.head_object(
-                            Bucket=self.bucket_name,
-                            Key=obj['Key']
-                        )
-                        
-                        metadata = head_response.get('Metadata', {})
-                        change_description = metadata.get('change-description', 'State update')
-                        version = metadata.get('version', 'unknown')
-                        
-                        snapshot = StateSnapshot(
-                            version=version,
-                            timestamp=timestamp,
-                            change_description=change_description,
-                            s3_location=f"s3://{self.bucket_name}/{obj['Key']}"
-                        )
-                        snapshots.append(snapshot)
-                        
-                    except ValueError as e:
-                        logger.warning(f"Failed to parse timestamp from key {obj['Key']}: {e}")
-                        continue
+            snapshots = await self._read_history_index(project_id)
+            if snapshots is None or (
+                len(snapshots) >= _HISTORY_INDEX_LIMIT and not (limit and limit <= len(snapshots))
+            ):
+                # No index yet, or more history requested than the capped index holds
+                snapshots = await self._list_history_snapshots(project_id, limit)
+            elif limit:
+                snapshots = snapshots[:limit]
             
             logger.info(f"Retrieved {len(snapshots)} historical snapshots for project {project_id}")
             return snapshots
@@ -308,6 +517,175 @@ class S3StateManagementService(StateManagementService):
                 {"project_id": project_id}
             )
     
+    async def _list_history_snapshots(self, project_id: str, limit: Optional[int]) -> List[StateSnapshot]:
+        """Build snapshots by listing history objects and reading their metadata
+        
+        Args:
+            project_id: Project identifier
+            limit: Maximum number of snapshots to return
+            
+        Returns:
+            Historical state snapshots, newest first
+        """
+        prefix = f"{self.bucket_prefix}/{project_id}/history/"
+        
+        # History keys embed a zero-padded timestamp, so S3's lexicographic
+        # listing order is already chronological; newest first is a reversal
+        keys = await self._run(self._list_keys, prefix)
+        keys.reverse()
+        
+        dated_keys = []
+        for key in keys:
+            # Extract timestamp from key
+            filename = key.rsplit('/', 1)[-1].replace('.json', '')
+            
+            try:
+                # Parse timestamp from filename (format: YYYYMMDD_HHMMSS_microseconds)
+                timestamp = datetime.strptime(filename, "%Y%m%d_%H%M%S_%f")
+            except ValueError as e:
+                logger.warning(f"Failed to parse timestamp from key {key}: {e}")
+                continue
+            
+            dated_keys.append((key, timestamp))
+            if limit and len(dated_keys) == limit:
+                break
+        
+        # Fetch metadata for all snapshots concurrently
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+        head_responses = await asyncio.gather(*[
+            self._fetch_head(key, semaphore) for key, _ in dated_keys
+        ])
+        
+        snapshots = []
+        for (key, timestamp), head_response in zip(dated_keys, head_responses):
+            metadata = head_response.get('Metadata', {})
+            change_description = metadata.get('change-description', 'State update')
+            version = metadata.get('version', 'unknown')
+            
+            snapshot = StateSnapshot(
+                version=version,
+                timestamp=timestamp,
+                change_description=change_description,
+                s3_location=self._s3_url_prefix + key
+            )
+            snapshots.append(snapshot)
+        
+        return snapshots
+    
+    async def _read_history_index(self, project_id: str) -> Optional[List[StateSnapshot]]:
+        """Read all history snapshots from the project's index in one request
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            Historical state snapshots, newest first, or None if no index exists
+        """
+        try:
+            _, body = await self._run(self._get_object, Key=self._get_history_index_key(project_id))
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise
+        
+        snapshots = []
+        for line in body.splitlines():
+            if not line:
+                continue
+            entry = _decode_state(line)
+            snapshots.append(StateSnapshot(
+                version=entry["version"],
+                timestamp=_as_datetime(entry["timestamp"]),
+                change_description=entry["changeDescription"],
+                s3_location=self._s3_url_prefix + entry['key']
+            ))
+        snapshots.reverse()
+        return snapshots
+    
+    async def _append_history_index(
+        self,
+        project_id: str,
+        history_key: str,
+        version: str,
+        timestamp: datetime,
+        change_description: str
+    ) -> None:
+        """Record a history snapshot in the project's index
+        
+        The index is rewritten with a put conditional on the ETag it was read
+        at, and re-read on conflict, so concurrent saves never drop each
+        other's entries. A missing index is built from a listing of the
+        history prefix, keeping snapshots written before the index existed.
+        Only the newest _HISTORY_INDEX_LIMIT entries are kept.
+        
+        Args:
+            project_id: Project identifier
+            history_key: S3 key the snapshot was written to
+            version: Version of the snapshotted state
+            timestamp: Timestamp of the snapshotted state
+            change_description: Change description of the snapshotted state
+        """
+        index_key = self._get_history_index_key(project_id)
+        entry = _encode_index_entry(history_key, version, timestamp, change_description)
+        
+        for _ in range(_INDEX_WRITE_ATTEMPTS):
+            try:
+                response, existing = await self._run(self._get_object, Key=index_key)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'NoSuchKey':
+                    raise
+                body = await self._backfill_history_index(project_id, history_key, entry)
+                condition = {'IfNoneMatch': '*'}
+            else:
+                lines = existing.splitlines(keepends=True)
+                lines.append(entry)
+                body = b"".join(lines[-_HISTORY_INDEX_LIMIT:])
+                condition = {'IfMatch': response['ETag']}
+            
+            try:
+                await self._run(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=index_key,
+                    Body=body,
+                    ContentType='application/x-ndjson',
+                    **condition
+                )
+                return
+            except ClientError as e:
+                if e.response['Error']['Code'] not in _INDEX_CONFLICT_CODES:
+                    raise
+        
+        logger.error(f"Gave up recording {history_key} in the history index for project {project_id}")
+    
+    async def _backfill_history_index(self, project_id: str, history_key: str, entry: bytes) -> bytes:
+        """Build a history index body from the snapshots already in S3
+        
+        Args:
+            project_id: Project identifier
+            history_key: S3 key of the snapshot being recorded
+            entry: Encoded index entry for that snapshot
+            
+        Returns:
+            JSON-lines index body, oldest snapshot first
+        """
+        snapshots = await self._list_history_snapshots(project_id, _HISTORY_INDEX_LIMIT)
+        snapshots.reverse()
+        
+        prefix_length = len(self._s3_url_prefix)
+        lines = [
+            _encode_index_entry(
+                snapshot.s3_location[prefix_length:],
+                snapshot.version,
+                snapshot.timestamp,
+                snapshot.change_description
+            )
+            for snapshot in snapshots
+            if snapshot.s3_location[prefix_length:] != history_key
+        ]
+        lines.append(entry)
+        return b"".join(lines[-_HISTORY_INDEX_LIMIT:])
+    
     def compare_states(self, current_state: InfrastructureState, desired_state: InfrastructureState) -> ChangePlan:
         """Compare two states and generate a change plan
         
@@ -319,53 +697,61 @@ class S3StateManagementService(StateManagementService):
             Change plan describing the differences
         """
         changes = []
+        append = changes.append
+        creates = updates = deletes = 0
+        
+        # Bind hot-loop lookups once
+        to_config = self._resource_to_config
+        differ = self._resources_differ
+        assess_risk = self._assess_update_risk
+        create, update, delete = ChangeAction.CREATE, ChangeAction.UPDATE, ChangeAction.DELETE
+        low_risk, high_risk = RiskLevel.LOW, RiskLevel.HIGH
         
         # Create resource maps for easier comparison
         current_resources = {r.id: r for r in current_state.resources}
         desired_resources = {r.id: r for r in desired_state.resources}
         
-        # Find resources to create (in desired but not in current)
-        for resource_id, resource in desired_resources.items():
+        # Creates come first, in desired order
+        for resource_id, desired_resource in desired_resources.items():
             if resource_id not in current_resources:
-                changes.append(Change(
-                    action=ChangeAction.CREATE,
-                    resource_type=resource.type,
+                append(Change(
+                    action=create,
+                    resource_type=desired_resource.type,
                     resource_id=resource_id,
-                    desired_config=self._resource_to_config(resource),
-                    risk_level=RiskLevel.LOW
+                    desired_config=to_config(desired_resource),
+                    risk_level=low_risk
                 ))
+                creates += 1
         
-        # Find resources to update or delete
+        # Then updates and deletes, in current order
         for resource_id, current_resource in current_resources.items():
-            if resource_id in desired_resources:
-                desired_resource = desired_resources[resource_id]
-                
-                # Check if resource needs updating
-                if self._resources_differ(current_resource, desired_resource):
-                    changes.append(Change(
-                        action=ChangeAction.UPDATE,
-                        resource_type=current_resource.type,
-                        resource_id=resource_id,
-                        current_config=self._resource_to_config(current_resource),
-                        desired_config=self._resource_to_config(desired_resource),
-                        risk_level=self._assess_update_risk(current_resource, desired_resource)
-                    ))
-            else:
-                # Resource exists in current but not in desired - delete it
-                changes.append(Change(
-                    action=ChangeAction.DELETE,
+            desired_resource = desired_resources.get(resource_id)
+            if desired_resource is None:
+                append(Change(
+                    action=delete,
+                    resource_type=current_resource.type,
+                    resource_id=resource_id,
+                    current_config=to_config(current_resource),
+                    risk_level=high_risk  # Deletions are always high risk
+                ))
+                deletes += 1
+            elif differ(current_resource, desired_resource):
+                append(Change(
+                    action=update,
                     resource_type=current_resource.type,
                     resource_id=resource_id,
-                    current_config=self._resource_to_config(current_resource),
-                    risk_level=RiskLevel.HIGH  # Deletions are always high risk
+                    current_config=to_config(current_resource),
+                    desired_config=to_config(desired_resource),
+                    risk_level=assess_risk(current_resource, desired_resource)
                 ))
+                updates += 1
         
         # Create summary
         summary = ChangeSummary(
             total_changes=len(changes),
-            creates=len([c for c in changes if c.action == ChangeAction.CREATE]),
-            updates=len([c for c in changes if c.action == ChangeAction.UPDATE]),
-            deletes=len([c for c in changes if c.action == ChangeAction.DELETE])
+            creates=creates,
+            updates=updates,
+            deletes=deletes
         )
         
         # Generate change plan
@@ -381,33 +767,49 @@ class S3StateManagementService(StateManagementService):
         logger.info(f"Generated change plan with {len(changes)} changes for project {desired_state.project_id}")
         return plan    
 
-    async def _save_to_history(self, project_id: str, state: InfrastructureState) -> None:
-        """Save current state to history before updating
+    async def _save_to_history(self, project_id: str) -> None:
+        """Copy the current state to history before updating
+        
+        The copy is server-side, so the state body is never downloaded or
+        re-serialized; only the current object's metadata is read.
         
         Args:
             project_id: Project identifier
-            state: State to save to history
         """
+        current_key = self._get_state_key(project_id)
         try:
-            history_key = self._get_history_key(project_id, state.timestamp)
-            state_data = self._serialize_state(state)
-            state_json = json.dumps(state_data, indent=2, default=str)
+            try:
+                head_response = await self._run(
+                    self.s3_client.head_object, Bucket=self.bucket_name, Key=current_key
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    return
+                raise
             
-            self.s3_client.put_object(
+            metadata = head_response.get('Metadata', {})
+            timestamp = (
+                datetime.fromisoformat(metadata['timestamp'])
+                if 'timestamp' in metadata else head_response['LastModified']
+            )
+            history_key = self._get_history_key(project_id, timestamp)
+            
+            await self._run(
+                self.s3_client.copy_object,
                 Bucket=self.bucket_name,
                 Key=history_key,
-                Body=state_json.encode('utf-8'),
-                ContentType='application/json',
-                Metadata={
-                    'project-id': project_id,
-                    'version': state.version,
-                    'timestamp': state.timestamp.isoformat(),
-                    'change-description': state.metadata.change_description,
-                    'last-modified-by': state.metadata.last_modified_by
-                }
+                CopySource={'Bucket': self.bucket_name, 'Key': current_key},
+                MetadataDirective='COPY'
+            )
+            await self._append_history_index(
+                project_id,
+                history_key,
+                metadata.get('version', 'unknown'),
+                timestamp,
+                metadata.get('change-description', 'State update')
             )
             
-            logger.info(f"Saved historical state for project {project_id} at {state.timestamp}")
+            logger.info(f"Saved historical state for project {project_id} at {timestamp}")
             
         except ClientError as e:
             logger.error(f"Failed to save historical state: {e}")
@@ -431,8 +833,7 @@ class S3StateManagementService(StateManagementService):
             
             # Save state to local file
             state_data = self._serialize_state(state)
-            with open(backup_file, 'w') as f:
-                json.dump(state_data, f, indent=2, default=str)
+            backup_file.write_bytes(_encode_state(state_data))
             
             logger.warning(f"Created local backup at {backup_file}")
             
@@ -451,7 +852,7 @@ class S3StateManagementService(StateManagementService):
         return {
             "version": "1.0.0",
             "projectId": state.project_id,
-            "timestamp": state.timestamp.isoformat(),
+            "timestamp": state.timestamp,
             "metadata": {
                 "lastModifiedBy": state.metadata.last_modified_by,
                 "changeDescription": state.metadata.change_description,
@@ -467,8 +868,8 @@ class S3StateManagementService(StateManagementService):
                     "properties": resource.properties,
                     "tags": resource.tags,
                     "status": resource.status.value,
-                    "createdAt": resource.created_at.isoformat(),
-                    "updatedAt": resource.updated_at.isoformat()
+                    "createdAt": resource.created_at,
+                    "updatedAt": resource.updated_at
                 }
                 for resource in state.resources
             ]
@@ -483,41 +884,41 @@ class S3StateManagementService(StateManagementService):
         Returns:
             Infrastructure state object
         """
-        from ..models.enums import ResourceStatus
-        from ..models.data_models import Resource
-        
         metadata = StateMetadata(
             last_modified_by=data["metadata"]["lastModifiedBy"],
             change_description=data["metadata"]["changeDescription"],
             change_plan_id=data["metadata"].get("changePlanId")
         )
         
-        resources = []
-        for resource_data in data["resources"]:
-            resource = Resource(
-                id=resource_data["id"],
-                project_id=data["projectId"],
-                type=resource_data["type"],
-                name=resource_data["name"],
-                region=resource_data["region"],
-                properties=resource_data["properties"],
-                tags=resource_data["tags"],
-                status=ResourceStatus(resource_data["status"]),
-                created_at=datetime.fromisoformat(resource_data["createdAt"]),
-                updated_at=datetime.fromisoformat(resource_data["updatedAt"]),
-                arn=resource_data.get("arn")
+        project_id = data["projectId"]
+        make_resource, status_of, as_datetime = Resource, ResourceStatus, _as_datetime
+        # Positional arguments in Resource field order: this runs once per resource
+        resources = [
+            make_resource(
+                resource_data["id"],
+                project_id,
+                resource_data["type"],
+                resource_data["name"],
+                resource_data["region"],
+                resource_data["properties"],
+                resource_data["tags"],
+                status_of(resource_data["status"]),
+                as_datetime(resource_data["createdAt"]),
+                as_datetime(resource_data["updatedAt"]),
+                resource_data.get("arn"),
             )
-            resources.append(resource)
+            for resource_data in data["resources"]
+        ]
         
         return InfrastructureState(
-            project_id=data["projectId"],
+            project_id=project_id,
             version=data.get("version", "1.0.0"),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=_as_datetime(data["timestamp"]),
             resources=resources,
             metadata=metadata
         )
     
-    def _resource_to_config(self, resource) -> 'ResourceConfig':
+    def _resource_to_config(self, resource) -> ResourceConfig:
         """Convert Resource to ResourceConfig
         
         Args:
@@ -526,8 +927,6 @@ class S3StateManagementService(StateManagementService):
         Returns:
             ResourceConfig object
         """
-        from ..models.data_models import ResourceConfig
-        
         return ResourceConfig(
             type=resource.type,
             name=resource.name,
@@ -545,19 +944,17 @@ class S3StateManagementService(StateManagementService):
         Returns:
             True if resources differ and update is needed
         """
-        # Compare properties (excluding timestamps and status)
-        if current.properties != desired.properties:
-            return True
-        
-        # Compare tags
-        if current.tags != desired.tags:
-            return True
-        
-        # Compare name
-        if current.name != desired.name:
-            return True
+        # Resources shared between states (e.g. from the state cache) are equal
+        if current is desired:
+            return False
         
-        return False
+        # Cheapest comparisons first; properties (excluding timestamps and
+        # status) are usually the largest dict, so they are compared last
+        return (
+            current.name != desired.name
+            or current.tags != desired.tags
+            or current.properties != desired.properties
+        )
     
     def _get_plan_key(self, project_id: str, plan_id: str) -> str:
         """Generate S3 key for change plan file
@@ -580,22 +977,16 @@ class S3StateManagementService(StateManagementService):
         """
         try:
             plan_data = self._serialize_plan(plan)
-            plan_json = json.dumps(plan_data, indent=2, default=str)
+            plan_body = _encode_state(plan_data)
             
             key = self._get_plan_key(project_id, plan.id)
             
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=plan_json.encode('utf-8'),
-                ContentType='application/json',
-                Metadata={
-                    'project-id': project_id,
-                    'plan-id': plan.id,
-                    'status': plan.status.value,
-                    'created-at': plan.created_at.isoformat()
-                }
-            )
+            await self._run(self._put_json, key, plan_body, {
+                'project-id': project_id,
+                'plan-id': plan.id,
+                'status': plan.status.value,
+                'created-at': plan.created_at.isoformat()
+            })
             
             logger.info(f"Saved change plan {plan.id} for project {project_id}")
             
@@ -620,10 +1011,8 @@ class S3StateManagementService(StateManagementService):
         try:
             key = self._get_plan_key(project_id, plan_id)
             
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            
-            plan_data = json.loads(content)
+            _, body = await self._run(self._get_object, Key=key)
+            plan_data = _decode_state(body)
             return self._deserialize_plan(plan_data)
             
         except ClientError as e:
@@ -638,7 +1027,7 @@ class S3StateManagementService(StateManagementService):
                     f"Failed to retrieve change plan from S3: {e}",
                     {"project_id": project_id, "plan_id": plan_id}
                 )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse change plan JSON: {e}")
             raise InfrastructureException(
                 ErrorCodes.STATE_FILE_CORRUPTED,
@@ -659,21 +1048,18 @@ class S3StateManagementService(StateManagementService):
         try:
             prefix = f"{self.bucket_prefix}/{project_id}/plans/"
             
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-            
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    key = obj['Key']
-                    try:
-                        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-                        content = response['Body'].read().decode('utf-8')
-                        plan_data = json.loads(content)
-                        plans.append(self._deserialize_plan(plan_data))
-                    except Exception as e:
-                        logger.warning(f"Failed to read or parse plan {key}: {e}")
+            keys = await self._run(self._list_keys, prefix)
+            if keys:
+                semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+                results = await asyncio.gather(
+                    *[self._fetch_plan(key, semaphore) for key in keys],
+                    return_exceptions=True
+                )
+                for key, result in zip(keys, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to read or parse plan {key}: {result}")
+                    else:
+                        plans.append(result)
 
             logger.info(f"Retrieved {len(plans)} change plans for project {project_id}")
             return plans
@@ -686,6 +1072,33 @@ class S3StateManagementService(StateManagementService):
                 {"project_id": project_id}
             )
 
+    async def _fetch_plan(self, key: str, semaphore: asyncio.Semaphore) -> ChangePlan:
+        """Download and parse one change plan without blocking the event loop
+        
+        Args:
+            key: S3 key of the plan
+            semaphore: Limits concurrent requests across a listing
+            
+        Returns:
+            The parsed change plan
+        """
+        async with semaphore:
+            _, body = await self._run(self._get_object, Key=key)
+        return self._deserialize_plan(_decode_state(body))
+
+    async def _fetch_head(self, key: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Issue a HEAD request without blocking the event loop
+        
+        Args:
+            key: S3 key to inspect
+            semaphore: Limits concurrent requests across a listing
+            
+        Returns:
+            The head_object response
+        """
+        async with semaphore:
+            return await self._run(self.s3_client.head_object, Bucket=self.bucket_name, Key=key)
+
     def _serialize_plan(self, plan: ChangePlan) -> Dict[str, Any]:
         """Serialize a ChangePlan to a dictionary
         
@@ -712,17 +1125,17 @@ class S3StateManagementService(StateManagementService):
                     "resourceType": change.resource_type,
                     "resourceId": change.resource_id,
                     "riskLevel": change.risk_level.value,
-                    "currentConfig": change.current_config.__dict__ if change.current_config else None,
-                    "desiredConfig": change.desired_config.__dict__ if change.desired_config else None,
+                    "currentConfig": change.current_config.to_dict() if change.current_config else None,
+                    "desiredConfig": change.desired_config.to_dict() if change.desired_config else None,
                     "dependencies": change.dependencies,
                 }
                 for change in plan.changes
             ],
-            "createdAt": plan.created_at.isoformat(),
+            "createdAt": plan.created_at,
             "status": plan.status.value,
             "createdBy": plan.created_by,
             "approvedBy": plan.approved_by,
-            "approvedAt": plan.approved_at.isoformat() if plan.approved_at else None,
+            "approvedAt": plan.approved_at,
         }
 
     def _deserialize_plan(self, data: Dict[str, Any]) -> ChangePlan:
@@ -744,29 +1157,33 @@ class S3StateManagementService(StateManagementService):
             estimated_duration=summary_data.get("estimatedDuration"),
         )
 
-        changes = []
-        for change_data in data["changes"]:
-            change = Change(
-                action=ChangeAction(change_data["action"]),
-                resource_type=change_data["resourceType"],
-                resource_id=change_data["resourceId"],
-                risk_level=RiskLevel(change_data["riskLevel"]),
-                current_config=change_data.get("currentConfig"),
-                desired_config=change_data.get("desiredConfig"),
-                dependencies=change_data.get("dependencies", []),
+        make_change, action_of, risk_of = Change, ChangeAction, RiskLevel
+        config_from = _config_from_dict
+        # Positional arguments in Change field order: this runs once per change
+        changes = [
+            make_change(
+                action_of(change_data["action"]),
+                change_data["resourceType"],
+                change_data["resourceId"],
+                config_from(change_data.get("currentConfig")),
+                config_from(change_data.get("desiredConfig")),
+                change_data.get("dependencies", []),
+                risk_of(change_data["riskLevel"]),
             )
-            changes.append(change)
+            for change_data in data["changes"]
+        ]
 
+        approved_at = data.get("approvedAt")
         return ChangePlan(
             id=data["id"],
             project_id=data["projectId"],
             summary=summary,
             changes=changes,
-            created_at=datetime.fromisoformat(data["createdAt"]),
+            created_at=_as_datetime(data["createdAt"]),
             status=ChangePlanStatus(data["status"]),
             created_by=data.get("createdBy"),
             approved_by=data.get("approvedBy"),
-            approved_at=datetime.fromisoformat(data["approvedAt"]) if data.get("approvedAt") else None,
+            approved_at=_as_datetime(approved_at) if approved_at else None,
         )
 
     
@@ -780,38 +1197,18 @@ class S3StateManagementService(StateManagementService):
         Returns:
             Risk level for the update
         """
-        # High-risk resource types
-        high_risk_types = {
-            'RDS::DBInstance',
-            'EC2::Instance',
-            'Lambda::Function',
-            'ECS::Service'
-        }
-        
-        # High-risk property changes
-        high_risk_properties = {
-            'instanceType',
-            'dbInstanceClass',
-            'engine',
-            'engineVersion',
-            'allocatedStorage'
-        }
+        if current.type not in _HIGH_RISK_TYPES:
+            return RiskLevel.LOW
         
-        if current.type in high_risk_types:
-            # Check if high-risk properties are changing
-            current_props = current.properties
-            desired_props = desired.properties
-            
-            for prop in high_risk_properties:
-                if (prop in current_props and prop in desired_props and 
-                    current_props[prop] != desired_props[prop]):
-                    return RiskLevel.HIGH
+        # High risk if a high-risk property present on both sides is changing
+        current_props = current.properties
+        desired_props = desired.properties
+        for prop in _HIGH_RISK_PROPERTIES & current_props.keys() & desired_props.keys():
+            if current_props[prop] != desired_props[prop]:
+                return RiskLevel.HIGH
         
-        # Medium risk for any property changes on important resources
-        if current.type in high_risk_types:
-            return RiskLevel.MEDIUM
-        
-        return RiskLevel.LOW
+        # Medium risk for any other changes on important resources
+        return RiskLevel.MEDIUM
     
     async def get_state_by_version(self, project_id: str, version: str) -> Optional[InfrastructureState]:
         """Get infrastructure state by specific version
@@ -826,10 +1223,8 @@ class S3StateManagementService(StateManagementService):
         try:
             key = self._get_state_key(project_id, version)
             
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            
-            state_data = json.loads(content)
+            _, body = await self._run(self._get_object, Key=key)
+            state_data = _decode_state(body)
             return self._deserialize_state(state_data)
             
         except ClientError as e:
@@ -844,7 +1239,7 @@ class S3StateManagementService(StateManagementService):
                     f"Failed to retrieve state from S3: {e}",
                     {"project_id": project_id, "version": version}
                 )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse state JSON: {e}")
             raise InfrastructureException(
                 ErrorCodes.STATE_FILE_CORRUPTED,
@@ -858,25 +1253,33 @@ class S3StateManagementService(StateManagementService):
         Args:
             project_id: Project identifier
         """
+        self._state_cache.pop(project_id, None)
         try:
             prefix = f"{self.bucket_prefix}/{project_id}/"
             
-            # List all objects with the project prefix
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+            # List all objects with the project prefix (paginated)
+            keys = await self._run(self._list_keys, prefix)
             
-            if 'Contents' in response:
-                # Delete all objects
-                objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
+            if keys:
+                # DeleteObjects accepts at most 1000 keys per request
+                batches = [
+                    keys[i:i + _DELETE_BATCH_SIZE]
+                    for i in range(0, len(keys), _DELETE_BATCH_SIZE)
+                ]
+                responses = await asyncio.gather(*[
+                    self._run(
+                        self.s3_client.delete_objects,
+                        Bucket=self.bucket_name,
+                        Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                    )
+                    for batch in batches
+                ])
                 
-                self.s3_client.delete_objects(
-                    Bucket=self.bucket_name,
-                    Delete={'Objects': objects_to_delete}
-                )
+                for response in responses:
+                    for error in response.get('Errors', ()):
+                        logger.warning(f"Failed to delete {error.get('Key')}: {error.get('Message')}")
                 
-                logger.info(f"Deleted {len(objects_to_delete)} state files for project {project_id}")
+                logger.info(f"Deleted {len(keys)} state files for project {project_id}")
             else:
                 logger.info(f"No state files found for project {project_id}")
                 
@@ -907,56 +1310,89 @@ class S3StateManagementService(StateManagementService):
             if not self._validate_state_structure(current_state):
                 return False
             
-            # Check a few historical states
+            # Check a few historical states, fetched concurrently. Saves that
+            # reuse a state timestamp overwrite the same history object, so
+            # each S3 location is only downloaded once per validation
             history = await self.get_state_history(project_id, limit=5)
-            for snapshot in history:
-                try:
-                    # Try to load historical state
-                    key = snapshot.s3_location.replace(f"s3://{self.bucket_name}/", "")
-                    response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-                    content = response['Body'].read().decode('utf-8')
-                    state_data = json.loads(content)
-                    historical_state = self._deserialize_state(state_data)
-                    
-                    if not self._validate_state_structure(historical_state):
-                        return False
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to validate historical state {snapshot.version}: {e}")
-                    return False
-            
-            return True
+            unique_snapshots = {snapshot.s3_location: snapshot for snapshot in history}
+            results = await asyncio.gather(
+                *[self._validate_snapshot(snapshot) for snapshot in unique_snapshots.values()]
+            )
+            return all(results)
             
         except Exception as e:
             logger.error(f"Failed to validate state integrity: {e}")
             return False
     
-    def _validate_state_structure(self, state: InfrastructureState) -> bool:
-        """Validate the structure of a state object
+    async def _validate_snapshot(self, snapshot: StateSnapshot) -> bool:
+        """Load one historical state and validate its structure
         
         Args:
-            state: State object to validate
+            snapshot: History entry to check
             
         Returns:
-            True if structure is valid
+            True if the snapshot loads and is structurally valid
         """
         try:
-            # Basic structure validation
-            if not state.project_id or not state.version or not state.timestamp:
-                return False
+            key = snapshot.s3_location.removeprefix(self._s3_url_prefix)
+            _, body = await self._run(self._get_object, Key=key)
+            return self._validate_state_data(_decode_state(body))
+        except Exception as e:
+            logger.warning(f"Failed to validate historical state {snapshot.version}: {e}")
+            return False
+    
+    def _validate_state_data(self, data: Dict[str, Any]) -> bool:
+        """Validate a decoded state document without building Resource objects
+        
+        Accepts exactly what _deserialize_state followed by
+        _validate_state_structure would; malformed fields raise as they would
+        during deserialization.
+        
+        Args:
+            data: Dictionary representation of the state
             
-            if not state.metadata or not state.metadata.last_modified_by:
+        Returns:
+            True if structure is valid
+        """
+        metadata = data["metadata"]
+        if "changeDescription" not in metadata or not metadata["lastModifiedBy"]:
+            return False
+        if not data["projectId"] or not data.get("version", "1.0.0"):
+            return False
+        
+        as_datetime = _as_datetime
+        as_datetime(data["timestamp"])
+        
+        required_keys, statuses = _RESOURCE_KEYS, _RESOURCE_STATUS_VALUES
+        for resource_data in data["resources"]:
+            if not required_keys <= resource_data.keys():
                 return False
+            if not (resource_data["id"] and resource_data["type"] and resource_data["name"]
+                    and resource_data["region"]):
+                return False
+            if resource_data["status"] not in statuses:
+                return False
+            as_datetime(resource_data["createdAt"])
+            as_datetime(resource_data["updatedAt"])
+        
+        return True
+    
+    def _validate_state_structure(self, state: InfrastructureState) -> bool:
+        """Validate the structure of a state object
+        
+        Args:
+            state: State object to validate
             
-            # Validate resources
-            for resource in state.resources:
-                if not resource.id or not resource.type or not resource.name:
-                    return False
-                
-                if not resource.region or not resource.status:
-                    return False
-            
-            return True
-            
-        except Exception:
-            return False
\ No newline at end of file
+        Returns:
+            True if structure is valid
+        """
+        metadata = state.metadata
+        return bool(
+            state.project_id and state.version and state.timestamp
+            and metadata and metadata.last_modified_by
+            and all(
+                resource.id and resource.type and resource.name
+                and resource.region and resource.status
+                for resource in state.resources
+            )
+        )
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 Service container for dependency injection and singleton instances
 """
-from typing import Dict, Any, Optional, Type
+import threading
+from typing import Callable, Dict, Any, Optional, Type
 
 from .project_management import ProjectManagementServiceImpl
 from .infrastructure_service import AWSInfrastructureService
@@ -12,37 +13,60 @@ from .aws_mcp_client import AWSMCPClient
 from .auth_service import JWTAuthService
 
 
+_instance_lock = threading.Lock()
+
+
 class ServiceContainer:
     """Container for service instances"""
     
     _instance = None
     
     def __new__(cls):
+        # Double-checked: the common path is a single attribute read
         if cls._instance is None:
-            cls._instance = super(ServiceContainer, cls).__new__(cls)
-            cls._instance._initialize()
+            with _instance_lock:
+                if cls._instance is None:
+                    instance = super(ServiceContainer, cls).__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
     
     def _initialize(self):
-        """Initialize service instances"""
+        """Register service factories; instances are built on first use"""
         self._services: Dict[str, Any] = {}
+        # Reentrant: factories resolve their dependencies through get_service
+        self._build_lock = threading.RLock()
         
-        # Create service instances
-        self._services["project_service"] = ProjectManagementServiceImpl()
-        self._services["state_service"] = S3StateManagementService()
-        self._services["aws_mcp_client"] = AWSMCPClient()
-        self._services["change_plan_engine"] = DefaultChangePlanEngine(self._services["state_service"])
-        self._services["infrastructure_service"] = AWSInfrastructureService(
-            self._services["aws_mcp_client"],
-            self._services["state_service"],
-            self._services["change_plan_engine"]
-        )
-        self._services["approval_service"] = ApprovalWorkflowServiceImpl()
-        self._services["auth_service"] = JWTAuthService()
+        self._factories: Dict[str, Callable[["ServiceContainer"], Any]] = {
+            "project_service": lambda c: ProjectManagementServiceImpl(),
+            "state_service": lambda c: S3StateManagementService(),
+            "aws_mcp_client": lambda c: AWSMCPClient(),
+            "change_plan_engine": lambda c: DefaultChangePlanEngine(c.get_service("state_service")),
+            "infrastructure_service": lambda c: AWSInfrastructureService(
+                c.get_service("aws_mcp_client"),
+                c.get_service("state_service"),
+                c.get_service("change_plan_engine")
+            ),
+            "approval_service": lambda c: ApprovalWorkflowServiceImpl(),
+            "auth_service": lambda c: JWTAuthService(),
+        }
     
     def get_service(self, service_name: str) -> Any:
-        """Get a service instance by name"""
-        return self._services.get(service_name)
+        """Get a service instance by name, creating it on first request"""
+        service = self._services.get(service_name)
+        if service is not None:
+            return service
+        
+        factory = self._factories.get(service_name)
+        if factory is None:
+            return None
+        
+        with self._build_lock:
+            service = self._services.get(service_name)
+            if service is None:
+                service = factory(self)
+                self._services[service_name] = service
+        return service
 
 
 # Global service container instance
@@ -22,22 +22,29 @@ class ViewService:
         # In-memory storage for demo
         self._views: Dict[str, View] = {}
         self._dashboards: Dict[str, Dashboard] = {}
+        # project_id -> ids in creation order (dicts used as ordered sets)
+        self._views_by_project: Dict[str, Dict[str, None]] = {}
+        self._dashboards_by_project: Dict[str, Dict[str, None]] = {}
+        # view_id -> ids of dashboards that reference it
+        self._dashboards_by_view: Dict[str, Dict[str, None]] = {}
 
     async def create_view(self, project_id: str, name: str, filters: ResourceFilter, user_id: str) -> View:
         """
         Create a new view
         """
-        view_id = str(uuid.uuid4())
+        view_id = uuid.uuid4().hex
+        now = datetime.now()
         view = View(
             id=view_id,
             project_id=project_id,
             name=name,
             filters=filters,
             created_by=user_id,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
         self._views[view_id] = view
+        self._views_by_project.setdefault(project_id, {})[view_id] = None
         return view
 
     async def get_view(self, view_id: str) -> Optional[View]:
@@ -50,7 +57,8 @@ class ViewService:
         """
         Get all views for a project
         """
-        return [view for view in self._views.values() if view.project_id == project_id]
+        views = self._views
+        return [views[view_id] for view_id in self._views_by_project.get(project_id, ())]
 
     async def update_view(self, view_id: str, name: str, filters: ResourceFilter) -> Optional[View]:
         """
@@ -70,11 +78,13 @@ class ViewService:
         Delete a view
         """
         if view_id in self._views:
-            del self._views[view_id]
+            view = self._views.pop(view_id)
+            self._discard_from_index(self._views_by_project, view.project_id, view_id)
             # Also remove from any dashboards
-            for dashboard in self._dashboards.values():
-                if view_id in dashboard.views:
-                    dashboard.views.remove(view_id)
+            for dashboard_id in self._dashboards_by_view.pop(view_id, ()):
+                views = self._dashboards[dashboard_id].views
+                if view_id in views:
+                    views.remove(view_id)
             return True
         return False
 
@@ -82,7 +92,8 @@ class ViewService:
         """
         Create a new dashboard
         """
-        dashboard_id = str(uuid.uuid4())
+        dashboard_id = uuid.uuid4().hex
+        now = datetime.now()
         dashboard = Dashboard(
             id=dashboard_id,
             project_id=project_id,
@@ -90,10 +101,13 @@ class ViewService:
             description=description,
             views=view_ids,
             created_by=user_id,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
         self._dashboards[dashboard_id] = dashboard
+        self._dashboards_by_project.setdefault(project_id, {})[dashboard_id] = None
+        for view_id in view_ids:
+            self._dashboards_by_view.setdefault(view_id, {})[dashboard_id] = None
         return dashboard
 
     async def get_dashboard(self, dashboard_id: str) -> Optional[Dashboard]:
@@ -106,7 +120,11 @@ class ViewService:
         """
         Get all dashboards for a project
         """
-        return [dashboard for dashboard in self._dashboards.values() if dashboard.project_id == project_id]
+        dashboards = self._dashboards
+        return [
+            dashboards[dashboard_id]
+            for dashboard_id in self._dashboards_by_project.get(project_id, ())
+        ]
 
     async def update_dashboard(self, dashboard_id: str, name: str, description: str, view_ids: List[str]) -> Optional[Dashboard]:
         """
@@ -115,6 +133,12 @@ class ViewService:
         if dashboard_id not in self._dashboards:
             return None
         dashboard = self._dashboards[dashboard_id]
+        old_view_ids = set(dashboard.views)
+        new_view_ids = set(view_ids)
+        for view_id in old_view_ids - new_view_ids:
+            self._discard_from_index(self._dashboards_by_view, view_id, dashboard_id)
+        for view_id in new_view_ids - old_view_ids:
+            self._dashboards_by_view.setdefault(view_id, {})[dashboard_id] = None
         dashboard.name = name
         dashboard.description = description
         dashboard.views = view_ids
@@ -127,6 +151,20 @@ class ViewService:
         Delete a dashboard
         """
         if dashboard_id in self._dashboards:
-            del self._dashboards[dashboard_id]
+            dashboard = self._dashboards.pop(dashboard_id)
+            self._discard_from_index(self._dashboards_by_project, dashboard.project_id, dashboard_id)
+            for view_id in dashboard.views:
+                self._discard_from_index(self._dashboards_by_view, view_id, dashboard_id)
             return True
         return False
+
+    @staticmethod
+    def _discard_from_index(index: Dict[str, Dict[str, None]], key: str, item_id: str) -> None:
+        """
+        Remove an id from an index entry, dropping the entry when empty
+        """
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(item_id, None)
+            if not ids:
+                del index[key]
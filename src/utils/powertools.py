@@ -2,12 +2,17 @@
 AWS Lambda Powertools utilities and decorators for the AWS Infrastructure Manager.
 """
 import functools
+import inspect
+import random
 import time
+import traceback
+from contextvars import ContextVar
 from typing import Any, Callable, Dict, Optional, TypeVar, Union
 from aws_lambda_powertools import Logger, Tracer, Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from config.logging import get_logger, get_tracer, get_metrics, log_error, add_metric
+from config.settings import settings
 
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -16,6 +21,199 @@ logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 metrics = get_metrics()
 
+# Placeholder for identifiers a traced call did not receive
+_UNKNOWN = "unknown"
+
+# Project of the innermost traced AWS operation, inherited by nested operations
+# (including across awaits) that are not given a project_id of their own
+_PROJECT_ID: ContextVar[str] = ContextVar("project_id", default=_UNKNOWN)
+
+# Fraction of successful traced calls that emit metrics; errors are always emitted
+_METRIC_SAMPLE_RATE = settings.logging.metrics_sample_rate
+_random = random.random
+
+# Longest exception message put on a subsegment annotation
+_MAX_ERROR_ANNOTATION_LENGTH = 512
+
+# X-Ray recorder behind the Powertools tracer; traced calls open subsegments on it
+_recorder = tracer.provider
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+def _is_recording(subsegment) -> bool:
+    """Whether annotations put on a subsegment will reach X-Ray
+    
+    The recorder yields None when there is no open segment and a dummy,
+    unsampled subsegment when tracing is disabled or sampled out.
+    """
+    return subsegment is not None and subsegment.sampled
+
+
+def _sampled_count() -> float:
+    """Count to report for a successful call, or 0 when its metrics are sampled out
+    
+    Sampled calls are weighted by the inverse of the sample rate so that summed
+    success counts stay unbiased.
+    """
+    rate = _METRIC_SAMPLE_RATE
+    if rate >= 1.0:
+        return 1
+    return 1 / rate if _random() < rate else 0
+
+
+def _error_message(error: Exception) -> str:
+    """str(error), truncated to fit a subsegment annotation"""
+    message = str(error)
+    if len(message) <= _MAX_ERROR_ANNOTATION_LENGTH:
+        return message
+    return message[:_MAX_ERROR_ANNOTATION_LENGTH] + "…"
+
+
+def _record_exception(subsegment, error: Exception) -> None:
+    """Attach an exception and its traceback to a subsegment, marking it as failed"""
+    stack = traceback.extract_tb(error.__traceback__, limit=_recorder.max_trace_back)
+    subsegment.add_exception(error, stack)
+
+
+def _end_subsegment(subsegment) -> None:
+    """Close a subsegment opened with _recorder.begin_subsegment"""
+    if subsegment is not None:
+        _recorder.end_subsegment()
+
+
+def _operation_started(subsegment, ctx: Dict[str, Any]) -> None:
+    """Record the start of a traced AWS operation on its subsegment and in the log"""
+    if _is_recording(subsegment):
+        subsegment.put_annotation("operation_name", ctx["operation"])
+        subsegment.put_annotation("project_id", ctx["project_id"])
+        if ctx["resource_type"]:
+            subsegment.put_annotation("resource_type", ctx["resource_type"])
+        if ctx["resource_id"] != _UNKNOWN:
+            subsegment.put_annotation("resource_id", ctx["resource_id"])
+    
+    logger.info("aws.operation.start", **ctx)
+
+
+def _operation_succeeded(
+    subsegment, dimensions: Dict[str, str], ctx: Dict[str, Any], duration_ms: float
+) -> None:
+    """Log, count and annotate a successful AWS operation"""
+    logger.info(
+        "aws.operation.complete",
+        **ctx,
+        duration_ms=duration_ms,
+        success=True
+    )
+    
+    # Add success metrics
+    count = _sampled_count()
+    if count:
+        add_metric(
+            name="AWSOperationSuccess",
+            value=count,
+            unit=MetricUnit.Count,
+            **dimensions,
+            project_id=ctx["project_id"]
+        )
+        
+        add_metric(
+            name="AWSOperationDuration",
+            value=duration_ms,
+            unit=MetricUnit.Milliseconds,
+            **dimensions
+        )
+    
+    if _is_recording(subsegment):
+        subsegment.put_annotation("operation_success", True)
+        subsegment.put_annotation("operation_duration_ms", duration_ms)
+
+
+def _operation_failed(
+    subsegment, dimensions: Dict[str, str], ctx: Dict[str, Any], error: Exception, duration_ms: float
+) -> None:
+    """Log, count and annotate an AWS operation that raised"""
+    log_error(error, context={**ctx, "duration_ms": duration_ms})
+    
+    # Add error metrics
+    add_metric(
+        name="AWSOperationError",
+        value=1,
+        unit=MetricUnit.Count,
+        **dimensions,
+        error_type=type(error).__name__,
+        project_id=ctx["project_id"]
+    )
+    
+    if _is_recording(subsegment):
+        subsegment.put_annotation("operation_success", False)
+        subsegment.put_annotation("operation_error", _error_message(error))
+        subsegment.put_annotation("operation_error_type", type(error).__name__)
+        _record_exception(subsegment, error)
+
+
+def _method_started(subsegment, ctx: Dict[str, Any]) -> None:
+    """Record the start of a traced service method on its subsegment and in the log"""
+    if _is_recording(subsegment):
+        subsegment.put_annotation("service_name", ctx["service"])
+        subsegment.put_annotation("method_name", ctx["method"])
+    
+    logger.info("service.method.start", **ctx)
+
+
+def _method_succeeded(subsegment, ctx: Dict[str, Any], duration_ms: float) -> None:
+    """Log, count and annotate a successful service method call"""
+    logger.info(
+        "service.method.complete",
+        **ctx,
+        duration_ms=duration_ms,
+        success=True
+    )
+    
+    # Add success metrics
+    count = _sampled_count()
+    if count:
+        add_metric(
+            name="ServiceMethodSuccess",
+            value=count,
+            unit=MetricUnit.Count,
+            **ctx
+        )
+        
+        add_metric(
+            name="ServiceMethodDuration",
+            value=duration_ms,
+            unit=MetricUnit.Milliseconds,
+            **ctx
+        )
+    
+    if _is_recording(subsegment):
+        subsegment.put_annotation("method_success", True)
+        subsegment.put_annotation("method_duration_ms", duration_ms)
+
+
+def _method_failed(subsegment, ctx: Dict[str, Any], error: Exception, duration_ms: float) -> None:
+    """Log, count and annotate a service method call that raised"""
+    log_error(error, context={**ctx, "duration_ms": duration_ms})
+    
+    # Add error metrics
+    add_metric(
+        name="ServiceMethodError",
+        value=1,
+        unit=MetricUnit.Count,
+        **ctx,
+        error_type=type(error).__name__
+    )
+    
+    if _is_recording(subsegment):
+        subsegment.put_annotation("method_success", False)
+        subsegment.put_annotation("method_error", _error_message(error))
+        subsegment.put_annotation("method_error_type", type(error).__name__)
+        _record_exception(subsegment, error)
+
 
 def trace_aws_operation(operation_name: str, resource_type: str = None):
     """
@@ -26,199 +224,63 @@ def trace_aws_operation(operation_name: str, resource_type: str = None):
         resource_type: Type of AWS resource (e.g., 'EC2::Instance')
     """
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            
+        dimensions = {"operation": operation_name, "resource_type": resource_type or _UNKNOWN}
+        
+        def operation_context(kwargs: Dict[str, Any]) -> Dict[str, Any]:
             # Extract project_id and resource_id from kwargs if available
-            project_id = kwargs.get('project_id', 'unknown')
-            resource_id = kwargs.get('resource_id', 'unknown')
-            
-            # Start tracing
-            with tracer.provider.get_tracer(__name__).start_as_current_span(operation_name) as span:
-                span.set_attribute("operation.name", operation_name)
-                span.set_attribute("project.id", project_id)
-                if resource_type:
-                    span.set_attribute("resource.type", resource_type)
-                if resource_id != 'unknown':
-                    span.set_attribute("resource.id", resource_id)
-                
-                logger.info(
-                    f"Starting AWS operation: {operation_name}",
-                    operation=operation_name,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    project_id=project_id
-                )
-                
+            kw_get = kwargs.get
+            return {
+                "operation": operation_name,
+                "resource_type": resource_type,
+                "resource_id": kw_get('resource_id', _UNKNOWN),
+                "project_id": kw_get('project_id') or _PROJECT_ID.get(),
+            }
+        
+        # Only the wrapper matching the function type is created
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                ctx = operation_context(kwargs)
+                # Start tracing
+                subsegment = _recorder.begin_subsegment(operation_name)
+                # Set only once nothing can fail before the try that resets it
+                token = _PROJECT_ID.set(ctx["project_id"])
                 try:
+                    _operation_started(subsegment, ctx)
                     result = await func(*args, **kwargs)
-                    
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    logger.info(
-                        f"AWS operation completed: {operation_name}",
-                        operation=operation_name,
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        project_id=project_id,
-                        duration_ms=duration_ms,
-                        success=True
-                    )
-                    
-                    # Add success metrics
-                    add_metric(
-                        name="AWSOperationSuccess",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown",
-                        project_id=project_id
-                    )
-                    
-                    add_metric(
-                        name="AWSOperationDuration",
-                        value=duration_ms,
-                        unit=MetricUnit.Milliseconds,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown"
-                    )
-                    
-                    span.set_attribute("operation.success", True)
-                    span.set_attribute("operation.duration_ms", duration_ms)
-                    
+                    _operation_succeeded(subsegment, dimensions, ctx, _elapsed_ms(start_ns))
                     return result
-                    
                 except Exception as e:
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    log_error(
-                        e,
-                        context={
-                            "operation": operation_name,
-                            "resource_type": resource_type,
-                            "resource_id": resource_id,
-                            "project_id": project_id,
-                            "duration_ms": duration_ms
-                        }
-                    )
-                    
-                    # Add error metrics
-                    add_metric(
-                        name="AWSOperationError",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown",
-                        error_type=type(e).__name__,
-                        project_id=project_id
-                    )
-                    
-                    span.set_attribute("operation.success", False)
-                    span.set_attribute("operation.error", str(e))
-                    span.set_attribute("operation.error_type", type(e).__name__)
-                    
+                    _operation_failed(subsegment, dimensions, ctx, e, _elapsed_ms(start_ns))
                     raise
+                finally:
+                    _end_subsegment(subsegment)
+                    _PROJECT_ID.reset(token)
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
-            
-            # Extract project_id and resource_id from kwargs if available
-            project_id = kwargs.get('project_id', 'unknown')
-            resource_id = kwargs.get('resource_id', 'unknown')
-            
+            start_ns = time.perf_counter_ns()
+            ctx = operation_context(kwargs)
             # Start tracing
-            with tracer.provider.get_tracer(__name__).start_as_current_span(operation_name) as span:
-                span.set_attribute("operation.name", operation_name)
-                span.set_attribute("project.id", project_id)
-                if resource_type:
-                    span.set_attribute("resource.type", resource_type)
-                if resource_id != 'unknown':
-                    span.set_attribute("resource.id", resource_id)
-                
-                logger.info(
-                    f"Starting AWS operation: {operation_name}",
-                    operation=operation_name,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    project_id=project_id
-                )
-                
-                try:
-                    result = func(*args, **kwargs)
-                    
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    logger.info(
-                        f"AWS operation completed: {operation_name}",
-                        operation=operation_name,
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        project_id=project_id,
-                        duration_ms=duration_ms,
-                        success=True
-                    )
-                    
-                    # Add success metrics
-                    add_metric(
-                        name="AWSOperationSuccess",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown",
-                        project_id=project_id
-                    )
-                    
-                    add_metric(
-                        name="AWSOperationDuration",
-                        value=duration_ms,
-                        unit=MetricUnit.Milliseconds,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown"
-                    )
-                    
-                    span.set_attribute("operation.success", True)
-                    span.set_attribute("operation.duration_ms", duration_ms)
-                    
-                    return result
-                    
-                except Exception as e:
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    log_error(
-                        e,
-                        context={
-                            "operation": operation_name,
-                            "resource_type": resource_type,
-                            "resource_id": resource_id,
-                            "project_id": project_id,
-                            "duration_ms": duration_ms
-                        }
-                    )
-                    
-                    # Add error metrics
-                    add_metric(
-                        name="AWSOperationError",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        operation=operation_name,
-                        resource_type=resource_type or "unknown",
-                        error_type=type(e).__name__,
-                        project_id=project_id
-                    )
-                    
-                    span.set_attribute("operation.success", False)
-                    span.set_attribute("operation.error", str(e))
-                    span.set_attribute("operation.error_type", type(e).__name__)
-                    
-                    raise
+            subsegment = _recorder.begin_subsegment(operation_name)
+            # Set only once nothing can fail before the try that resets it
+            token = _PROJECT_ID.set(ctx["project_id"])
+            try:
+                _operation_started(subsegment, ctx)
+                result = func(*args, **kwargs)
+                _operation_succeeded(subsegment, dimensions, ctx, _elapsed_ms(start_ns))
+                return result
+            except Exception as e:
+                _operation_failed(subsegment, dimensions, ctx, e, _elapsed_ms(start_ns))
+                raise
+            finally:
+                _end_subsegment(subsegment)
+                _PROJECT_ID.reset(token)
         
-        # Return appropriate wrapper based on function type
-        if hasattr(func, '__code__') and 'async' in str(func.__code__.co_flags):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -234,166 +296,45 @@ def trace_service_method(service_name: str, method_name: str = None):
     def decorator(func: F) -> F:
         operation_name = method_name or func.__name__
         full_operation_name = f"{service_name}.{operation_name}"
+        ctx = {"service": service_name, "method": operation_name}
         
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            
-            with tracer.provider.get_tracer(__name__).start_as_current_span(full_operation_name) as span:
-                span.set_attribute("service.name", service_name)
-                span.set_attribute("method.name", operation_name)
-                
-                logger.info(
-                    f"Starting service method: {full_operation_name}",
-                    service=service_name,
-                    method=operation_name
-                )
+        # Only the wrapper matching the function type is created
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
                 
+                subsegment = _recorder.begin_subsegment(full_operation_name)
                 try:
+                    _method_started(subsegment, ctx)
                     result = await func(*args, **kwargs)
-                    
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    logger.info(
-                        f"Service method completed: {full_operation_name}",
-                        service=service_name,
-                        method=operation_name,
-                        duration_ms=duration_ms,
-                        success=True
-                    )
-                    
-                    # Add success metrics
-                    add_metric(
-                        name="ServiceMethodSuccess",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        service=service_name,
-                        method=operation_name
-                    )
-                    
-                    add_metric(
-                        name="ServiceMethodDuration",
-                        value=duration_ms,
-                        unit=MetricUnit.Milliseconds,
-                        service=service_name,
-                        method=operation_name
-                    )
-                    
-                    span.set_attribute("method.success", True)
-                    span.set_attribute("method.duration_ms", duration_ms)
-                    
+                    _method_succeeded(subsegment, ctx, _elapsed_ms(start_ns))
                     return result
-                    
                 except Exception as e:
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    log_error(
-                        e,
-                        context={
-                            "service": service_name,
-                            "method": operation_name,
-                            "duration_ms": duration_ms
-                        }
-                    )
-                    
-                    # Add error metrics
-                    add_metric(
-                        name="ServiceMethodError",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        service=service_name,
-                        method=operation_name,
-                        error_type=type(e).__name__
-                    )
-                    
-                    span.set_attribute("method.success", False)
-                    span.set_attribute("method.error", str(e))
-                    span.set_attribute("method.error_type", type(e).__name__)
-                    
+                    _method_failed(subsegment, ctx, e, _elapsed_ms(start_ns))
                     raise
+                finally:
+                    _end_subsegment(subsegment)
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
-            with tracer.provider.get_tracer(__name__).start_as_current_span(full_operation_name) as span:
-                span.set_attribute("service.name", service_name)
-                span.set_attribute("method.name", operation_name)
-                
-                logger.info(
-                    f"Starting service method: {full_operation_name}",
-                    service=service_name,
-                    method=operation_name
-                )
-                
-                try:
-                    result = func(*args, **kwargs)
-                    
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    logger.info(
-                        f"Service method completed: {full_operation_name}",
-                        service=service_name,
-                        method=operation_name,
-                        duration_ms=duration_ms,
-                        success=True
-                    )
-                    
-                    # Add success metrics
-                    add_metric(
-                        name="ServiceMethodSuccess",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        service=service_name,
-                        method=operation_name
-                    )
-                    
-                    add_metric(
-                        name="ServiceMethodDuration",
-                        value=duration_ms,
-                        unit=MetricUnit.Milliseconds,
-                        service=service_name,
-                        method=operation_name
-                    )
-                    
-                    span.set_attribute("method.success", True)
-                    span.set_attribute("method.duration_ms", duration_ms)
-                    
-                    return result
-                    
-                except Exception as e:
-                    duration_ms = (time.time() - start_time) * 1000
-                    
-                    log_error(
-                        e,
-                        context={
-                            "service": service_name,
-                            "method": operation_name,
-                            "duration_ms": duration_ms
-                        }
-                    )
-                    
-                    # Add error metrics
-                    add_metric(
-                        name="ServiceMethodError",
-                        value=1,
-                        unit=MetricUnit.Count,
-                        service=service_name,
-                        method=operation_name,
-                        error_type=type(e).__name__
-                    )
-                    
-                    span.set_attribute("method.success", False)
-                    span.set_attribute("method.error", str(e))
-                    span.set_attribute("method.error_type", type(e).__name__)
-                    
-                    raise
+            subsegment = _recorder.begin_subsegment(full_operation_name)
+            try:
+                _method_started(subsegment, ctx)
+                result = func(*args, **kwargs)
+                _method_succeeded(subsegment, ctx, _elapsed_ms(start_ns))
+                return result
+            except Exception as e:
+                _method_failed(subsegment, ctx, e, _elapsed_ms(start_ns))
+                raise
+            finally:
+                _end_subsegment(subsegment)
         
-        # Return appropriate wrapper based on function type
-        if hasattr(func, '__code__') and 'async' in str(func.__code__.co_flags):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -432,22 +373,25 @@ def lambda_handler_with_powertools(
 class PowertoolsContext:
     """Context manager for Powertools operations."""
     
+    __slots__ = ('operation_name', 'metadata', 'start_ns')
+    
     def __init__(self, operation_name: str, **metadata):
         self.operation_name = operation_name
-        self.metadata = metadata
-        self.start_time = None
+        # Logged with every event; the operation is a field, not part of the message
+        self.metadata = {"operation": operation_name, **metadata}
+        self.start_ns = None
         
     def __enter__(self):
-        self.start_time = time.time()
-        logger.info(f"Starting operation: {self.operation_name}", **self.metadata)
+        self.start_ns = time.perf_counter_ns()
+        logger.info("operation.start", **self.metadata)
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = (time.time() - self.start_time) * 1000
+        duration_ms = _elapsed_ms(self.start_ns)
         
         if exc_type is None:
             logger.info(
-                f"Operation completed: {self.operation_name}",
+                "operation.complete",
                 duration_ms=duration_ms,
                 success=True,
                 **self.metadata
@@ -460,7 +404,7 @@ class PowertoolsContext:
             )
         else:
             logger.exception(
-                f"Operation failed: {self.operation_name}",
+                "operation.failed",
                 duration_ms=duration_ms,
                 success=False,
                 error_type=exc_type.__name__,
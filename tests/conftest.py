@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the API end-to-end tests
+
+Environment variables:
+- TEST_USER_ID: User ID for testing (default: test-user)
+"""
+import itertools
+import os
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Get configuration from environment variables
+TEST_USER_ID = os.environ.get("TEST_USER_ID", "test-user")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create the FastAPI application once per test session"""
+    # Imported here so unit tests that never touch the API do not load the app
+    from src.app import create_app
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a FastAPI test client shared by every test in the session"""
+    with TestClient(app) as client:
+        # Add test headers
+        client.headers.update({"x-user-id": TEST_USER_ID})
+        yield client
+
+
+@pytest.fixture(scope="session")
+def unique_suffix():
+    """Return a factory of suffixes that keep test names unique within the session"""
+    run_id = uuid.uuid4().hex[:8]
+    counter = itertools.count()
+    return lambda: f"{run_id}-{next(counter)}"
+
+
+@pytest.fixture(autouse=True)
+def correlation_id(request, unique_suffix):
+    """Give each test that uses a client its own correlation id"""
+    if "client" in request.fixturenames:
+        client = request.getfixturevalue("client")
+        client.headers["x-correlation-id"] = f"test-{unique_suffix()}"
@@ -7,32 +7,12 @@ They test the complete workflow through the API layer.
 Environment variables:
 - TEST_USER_ID: User ID for testing (default: test-user)
 """
-import os
 import pytest
-import uuid
 import json
 from datetime import datetime
-from fastapi.testclient import TestClient
 
-from src.app import create_app
 from src.models.enums import ResourceStatus, ChangePlanStatus
 
-# Get configuration from environment variables
-TEST_USER_ID = os.environ.get("TEST_USER_ID", "test-user")
-
-
-@pytest.fixture
-def client():
-    """Create FastAPI test client"""
-    app = create_app()
-    with TestClient(app) as client:
-        # Add test headers
-        client.headers.update({
-            "x-user-id": TEST_USER_ID,
-            "x-correlation-id": f"test-{uuid.uuid4().hex}"
-        })
-        yield client
-
 
 @pytest.mark.end_to_end
 def test_api_health_check(client):
@@ -44,17 +24,17 @@ def test_api_health_check(client):
 
 
 @pytest.mark.end_to_end
-def test_api_complete_workflow(client):
+def test_api_complete_workflow(client, unique_suffix):
     """Test complete workflow through API endpoints"""
     # Step 1: Create a project
     print("Step 1: Creating a project")
     
-    project_name = f"API Test Project {uuid.uuid4().hex[:8]}"
+    project_name = f"API Test Project {unique_suffix()}"
     project_data = {
         "name": project_name,
         "description": "Project for API testing",
         "settings": {
-            "s3_bucket_path": f"s3://aws-infra-manager-test/api-test/{uuid.uuid4().hex}",
+            "s3_bucket_path": f"s3://aws-infra-manager-test/api-test/{unique_suffix()}",
             "default_region": "us-east-1"
         }
     }
@@ -69,7 +49,7 @@ def test_api_complete_workflow(client):
     # Step 2: Create a resource
     print("Step 2: Creating a resource")
     
-    resource_name = f"api-test-instance-{uuid.uuid4().hex[:8]}"
+    resource_name = f"api-test-instance-{unique_suffix()}"
     resource_data = {
         "type": "EC2::Instance",
         "name": resource_name,
@@ -206,25 +186,25 @@ def test_api_complete_workflow(client):
 
 
 @pytest.mark.end_to_end
-def test_api_project_isolation(client):
+def test_api_project_isolation(client, unique_suffix):
     """Test project isolation through API endpoints"""
     # Create two projects
     print("Creating two test projects")
     
     project_data1 = {
-        "name": f"API Isolation Test 1 {uuid.uuid4().hex[:8]}",
+        "name": f"API Isolation Test 1 {unique_suffix()}",
         "description": "First project for isolation testing",
         "settings": {
-            "s3_bucket_path": f"s3://aws-infra-manager-test/api-isolation-test-1/{uuid.uuid4().hex}",
+            "s3_bucket_path": f"s3://aws-infra-manager-test/api-isolation-test-1/{unique_suffix()}",
             "default_region": "us-east-1"
         }
     }
     
     project_data2 = {
-        "name": f"API Isolation Test 2 {uuid.uuid4().hex[:8]}",
+        "name": f"API Isolation Test 2 {unique_suffix()}",
         "description": "Second project for isolation testing",
         "settings": {
-            "s3_bucket_path": f"s3://aws-infra-manager-test/api-isolation-test-2/{uuid.uuid4().hex}",
+            "s3_bucket_path": f"s3://aws-infra-manager-test/api-isolation-test-2/{unique_suffix()}",
             "default_region": "us-east-1"
         }
     }
@@ -244,7 +224,7 @@ def test_api_project_isolation(client):
     # Create resources in both projects
     resource_data1 = {
         "type": "EC2::Instance",
-        "name": f"isolation-test-1-{uuid.uuid4().hex[:8]}",
+        "name": f"isolation-test-1-{unique_suffix()}",
         "properties": {
             "instanceType": "t3.micro",
             "imageId": "ami-12345678"
@@ -257,7 +237,7 @@ def test_api_project_isolation(client):
     
     resource_data2 = {
         "type": "EC2::Instance",
-        "name": f"isolation-test-2-{uuid.uuid4().hex[:8]}",
+        "name": f"isolation-test-2-{unique_suffix()}",
         "properties": {
             "instanceType": "t3.large",
             "imageId": "ami-87654321"
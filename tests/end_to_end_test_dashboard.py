@@ -6,42 +6,22 @@ These tests validate the dashboard API endpoints and their integration with the
 Environment variables:
 - TEST_USER_ID: User ID for testing (default: test-user)
 """
-import os
 import pytest
-import uuid
 import json
 from datetime import datetime
-from fastapi.testclient import TestClient
 
-from src.app import create_app
 from src.models.enums import ResourceStatus, ChangePlanStatus
 
-# Get configuration from environment variables
-TEST_USER_ID = os.environ.get("TEST_USER_ID", "test-user")
 
-
-@pytest.fixture
-def client():
-    """Create FastAPI test client"""
-    app = create_app()
-    with TestClient(app) as client:
-        # Add test headers
-        client.headers.update({
-            "x-user-id": TEST_USER_ID,
-            "x-correlation-id": f"test-{uuid.uuid4().hex}"
-        })
-        yield client
-
-
-@pytest.fixture
-def test_project(client):
-    """Create a test project for dashboard testing"""
-    project_name = f"Dashboard Test Project {uuid.uuid4().hex[:8]}"
+@pytest.fixture(scope="module")
+def test_project(client, unique_suffix):
+    """Create a test project shared by the dashboard tests"""
+    project_name = f"Dashboard Test Project {unique_suffix()}"
     project_data = {
         "name": project_name,
         "description": "Project for dashboard API testing",
         "settings": {
-            "s3_bucket_path": f"s3://aws-infra-manager-test/dashboard-test/{uuid.uuid4().hex}",
+            "s3_bucket_path": f"s3://aws-infra-manager-test/dashboard-test/{unique_suffix()}",
             "default_region": "us-east-1"
         }
     }
@@ -53,16 +33,16 @@ def test_project(client):
     return project
 
 
-@pytest.fixture
-def test_resources(client, test_project):
-    """Create test resources for dashboard testing"""
+@pytest.fixture(scope="module")
+def test_resources(client, test_project, unique_suffix):
+    """Create test resources shared by the dashboard tests, deleting them afterwards"""
     project_id = test_project["id"]
     resources = []
     
     # Create EC2 instance
     ec2_data = {
         "type": "EC2::Instance",
-        "name": f"dashboard-test-ec2-{uuid.uuid4().hex[:8]}",
+        "name": f"dashboard-test-ec2-{unique_suffix()}",
         "properties": {
             "instanceType": "t3.micro",
             "imageId": "ami-12345678"
@@ -80,7 +60,7 @@ def test_resources(client, test_project):
     # Create S3 bucket
     s3_data = {
         "type": "S3::Bucket",
-        "name": f"dashboard-test-s3-{uuid.uuid4().hex[:8]}",
+        "name": f"dashboard-test-s3-{unique_suffix()}",
         "properties": {
             "versioning": True,
             "region": "us-east-1"
@@ -98,7 +78,7 @@ def test_resources(client, test_project):
     # Create RDS instance
     rds_data = {
         "type": "RDS::DBInstance",
-        "name": f"dashboard-test-rds-{uuid.uuid4().hex[:8]}",
+        "name": f"dashboard-test-rds-{unique_suffix()}",
         "properties": {
             "dbInstanceClass": "db.t3.micro",
             "engine": "mysql",
@@ -114,7 +94,12 @@ def test_resources(client, test_project):
     assert response.status_code == 201, f"Failed to create RDS resource: {response.text}"
     resources.append(response.json())
     
-    return resources
+    yield resources
+    
+    # Delete all resources
+    for resource in resources:
+        response = client.delete(f"/projects/{project_id}/resources/{resource['id']}")
+        assert response.status_code == 204, f"Failed to delete resource {resource['id']}: {response.text}"
 
 
 @pytest.mark.end_to_end
@@ -298,18 +283,5 @@ def test_dashboard_pending_approvals(client, test_project, test_resources):
     assert len(updated_approvals["pending"]) >= len(approvals["pending"]), "Should have at least the same number of pending approvals"
 
 
-@pytest.mark.end_to_end
-def test_cleanup(client, test_project, test_resources):
-    """Clean up test resources"""
-    project_id = test_project["id"]
-    
-    # Delete all resources
-    for resource in test_resources:
-        response = client.delete(f"/projects/{project_id}/resources/{resource['id']}")
-        assert response.status_code == 204, f"Failed to delete resource {resource['id']}: {response.text}"
-    
-    print("All test resources deleted successfully")
-
-
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__])
\ No newline at end of file
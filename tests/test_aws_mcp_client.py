@@ -11,6 +11,7 @@ import httpx
 from src.services.aws_mcp_client import (
     AWSMCPClient, CircuitBreaker, RetryHandler, CircuitBreakerState,
     CircuitBreakerConfig, RetryConfig, MCPRequest, MCPResponse,
+    AdaptiveConcurrencyLimiter, ConcurrencyLimitConfig, is_throttling_error,
     create_aws_mcp_client
 )
 from src.models.data_models import Resource, ResourceConfig, ResourceFilter
@@ -135,6 +136,94 @@ class TestRetryHandler:
             await retry_handler.execute_with_retry(always_failing_func)
         
         assert call_count == 3  # Initial attempt + 2 retries
+    
+    def test_throttling_delay_uses_full_jitter(self):
+        """Test throttling backoff stays within the exponential window"""
+        config = RetryConfig(base_delay=1.0, max_delay=60.0)
+        retry_handler = RetryHandler(config)
+        
+        for attempt in range(4):
+            delay = retry_handler._calculate_throttling_delay(attempt)
+            assert 0 <= delay <= 2 ** attempt
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD concurrency limiter functionality"""
+    
+    def test_is_throttling_error(self):
+        """Test throttling error detection"""
+        assert is_throttling_error(Exception("ThrottlingException: Rate exceeded"))
+        assert is_throttling_error(Exception("RequestLimitExceeded"))
+        assert not is_throttling_error(Exception("Resource not found"))
+    
+    @pytest.mark.asyncio
+    async def test_limiter_decreases_on_throttling(self):
+        """Test limit is cut multiplicatively when throttled"""
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=8))
+        
+        async def throttled_func():
+            raise Exception("ThrottlingException: Rate exceeded")
+        
+        with pytest.raises(Exception):
+            await limiter.call(throttled_func)
+        
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_limiter_increases_on_success(self):
+        """Test limit grows additively on success and respects the maximum"""
+        limiter = AdaptiveConcurrencyLimiter(
+            ConcurrencyLimitConfig(initial_limit=2, max_limit=3)
+        )
+        
+        async def success_func():
+            return "success"
+        
+        assert await limiter.call(success_func) == "success"
+        assert limiter.limit == 2.5
+        
+        for _ in range(10):
+            await limiter.call(success_func)
+        assert limiter.limit == 3
+    
+    @pytest.mark.asyncio
+    async def test_limiter_bounds_concurrency(self):
+        """Test no more than the limit of calls run concurrently"""
+        limiter = AdaptiveConcurrencyLimiter(
+            ConcurrencyLimitConfig(initial_limit=2, max_limit=2)
+        )
+        running = 0
+        peak = 0
+        
+        async def tracked_func():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+        
+        await asyncio.gather(*(limiter.call(tracked_func) for _ in range(6)))
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_limiter_cancelled_call_keeps_limit(self):
+        """Test a cancelled call releases its slot without adjusting the limit"""
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=4))
+        started = asyncio.Event()
+        
+        async def slow_func():
+            started.set()
+            await asyncio.sleep(10)
+        
+        task = asyncio.create_task(limiter.call(slow_func))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
 
 
 class TestAWSMCPClient:
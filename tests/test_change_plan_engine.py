@@ -7,7 +7,6 @@ from unittest.mock import Mock, AsyncMock
 from typing import List, Optional
 
 from src.services.change_plan_engine import DefaultChangePlanEngine
-from src.services.interfaces import StateManagementService
 from src.models.data_models import (
     InfrastructureState, Resource, ResourceConfig, StateMetadata,
     Change, ChangeAction, RiskLevel, ChangePlan, ChangePlanStatus,
@@ -17,7 +16,7 @@ from src.models.enums import ResourceStatus
 from src.models.exceptions import InfrastructureException, ErrorCodes
 
 
-class MockStateManagementService(StateManagementService):
+class MockStateManagementService:
     """Mock state management service for testing"""
     
     def __init__(self):
@@ -301,7 +301,31 @@ class TestUpdateResource:
         assert "tags" in update_params
         assert "ProjectId" in update_params["tags"]
         assert "Environment" in update_params["tags"]
-    
+
+    @pytest.mark.asyncio
+    async def test_update_resource_unchanged_skips_state_save(
+        self,
+        infrastructure_service,
+        mock_aws_mcp_client,
+        mock_state_service,
+        sample_resource,
+        sample_infrastructure_state
+    ):
+        """Test that an idempotent update does not rewrite the stored state"""
+        # Setup mocks
+        mock_aws_mcp_client.get_resource.return_value = sample_resource
+        mock_aws_mcp_client.update_resource.return_value = sample_resource
+        mock_state_service.get_current_state.return_value = sample_infrastructure_state
+
+        updates = ResourceUpdate(properties={"InstanceType": "t3.micro"})
+
+        # Execute
+        result = await infrastructure_service.update_resource("test-project", sample_resource.id, updates)
+
+        # Verify
+        assert result == sample_resource
+        mock_state_service.save_state.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_resource_not_found(
         self,
@@ -370,7 +394,31 @@ class TestDeleteResource:
             project_id="test-project",
             resource_id="resource-id"
         )
-    
+
+    @pytest.mark.asyncio
+    async def test_delete_resource_single_lookup(
+        self,
+        infrastructure_service,
+        mock_aws_mcp_client,
+        mock_state_service,
+        sample_resource,
+        sample_infrastructure_state
+    ):
+        """Test that deletion fetches the resource and the state only once"""
+        # Setup mocks
+        mock_aws_mcp_client.get_resource.return_value = sample_resource
+        mock_aws_mcp_client.delete_resource.return_value = True
+        mock_state_service.get_current_state.return_value = sample_infrastructure_state
+
+        # Execute
+        await infrastructure_service.delete_resource("test-project", sample_resource.id)
+
+        # Verify
+        mock_aws_mcp_client.get_resource.assert_called_once()
+        mock_state_service.get_current_state.assert_called_once_with("test-project")
+        saved_state = mock_state_service.save_state.call_args[0][1]
+        assert saved_state.resources == []
+
     @pytest.mark.asyncio
     async def test_delete_resource_not_found(
         self,
@@ -520,7 +568,18 @@ class TestHelperMethods:
         # Tags enhanced with project context
         assert enhanced.tags["Environment"] == "test"
         assert enhanced.tags["ProjectId"] == "test-project"
-    
+
+        # Caller's filter is left untouched
+        assert original_filter.tags == {"Environment": "test"}
+
+    def test_enhance_resource_filter_default(self, infrastructure_service):
+        """Test resource filter enhancement without caller filters"""
+        enhanced = infrastructure_service._enhance_resource_filter("test-project", None)
+
+        assert enhanced.tags == {"ProjectId": "test-project"}
+        assert enhanced.resource_type is None
+        assert infrastructure_service._enhance_resource_filter("test-project", None) is enhanced
+
     def test_filter_resources_by_project(self, infrastructure_service):
         """Test project-based resource filtering"""
         resources = [
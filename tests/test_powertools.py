@@ -0,0 +1,128 @@
+"""
+Unit tests for Powertools decorators
+"""
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.powertools import _PROJECT_ID, trace_aws_operation, trace_service_method
+
+
+class TestTraceDecorators:
+    """Test cases for the tracing decorators"""
+
+    def test_async_functions_get_async_wrapper(self):
+        """Test that decorating a coroutine function keeps it awaitable"""
+        @trace_aws_operation("describe_instances", "EC2::Instance")
+        async def describe_instances():
+            return []
+
+        @trace_service_method("InfrastructureService")
+        async def list_resources():
+            return []
+
+        assert inspect.iscoroutinefunction(describe_instances)
+        assert inspect.iscoroutinefunction(list_resources)
+
+    def test_sync_functions_get_sync_wrapper(self):
+        """Test that decorating a plain function keeps it synchronous"""
+        @trace_aws_operation("describe_instances")
+        def describe_instances():
+            return []
+
+        assert not inspect.iscoroutinefunction(describe_instances)
+        assert describe_instances.__name__ == "describe_instances"
+
+    async def test_async_wrapper_returns_result(self):
+        """Test that a traced coroutine is awaited and its result returned"""
+        @trace_aws_operation("describe_instances", "EC2::Instance")
+        async def describe_instances(project_id=None):
+            return ["i-123"]
+
+        assert await describe_instances(project_id="proj-1") == ["i-123"]
+
+    def test_sync_wrapper_reraises(self):
+        """Test that errors from a traced method propagate to the caller"""
+        @trace_service_method("InfrastructureService")
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            fail()
+
+    def test_missing_segment_does_not_break_call(self):
+        """Test that a traced call works when the recorder yields no subsegment"""
+        @trace_aws_operation("describe_instances")
+        def describe_instances(project_id=None):
+            return ["i-123"]
+
+        with patch("src.utils.powertools._recorder.begin_subsegment", return_value=None), \
+                patch("src.utils.powertools._recorder.end_subsegment") as end_subsegment:
+            assert describe_instances(project_id="proj-1") == ["i-123"]
+
+        end_subsegment.assert_not_called()
+
+    def test_project_id_not_leaked_when_tracing_fails(self):
+        """Test that a failing begin_subsegment leaves the caller's project_id untouched"""
+        @trace_aws_operation("describe_instances")
+        def describe_instances(project_id=None):
+            return []
+
+        with patch("src.utils.powertools._recorder.begin_subsegment", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                describe_instances(project_id="proj-1")
+
+        assert _PROJECT_ID.get() == "unknown"
+
+    async def test_nested_operations_inherit_project_id(self):
+        """Test that an inner operation without project_id reports the outer one"""
+        @trace_aws_operation("describe_instance")
+        async def describe_instance():
+            return "i-123"
+
+        @trace_aws_operation("list_instances")
+        async def list_instances(project_id=None):
+            return [await describe_instance()]
+
+        with patch("src.utils.powertools.add_metric") as add_metric:
+            assert await list_instances(project_id="proj-1") == ["i-123"]
+            await describe_instance()
+
+        project_ids = [
+            call.kwargs["project_id"] for call in add_metric.call_args_list
+            if call.kwargs["name"] == "AWSOperationSuccess"
+        ]
+        assert project_ids == ["proj-1", "proj-1", "unknown"]
+
+    def test_success_metrics_are_sampled_and_weighted(self):
+        """Test that sampled-out calls emit no success metrics and kept ones are weighted"""
+        @trace_service_method("InfrastructureService")
+        def list_resources():
+            return []
+
+        with patch("src.utils.powertools._METRIC_SAMPLE_RATE", 0.25), \
+                patch("src.utils.powertools._random", side_effect=[0.5, 0.1]), \
+                patch("src.utils.powertools.add_metric") as add_metric:
+            list_resources()
+            assert not add_metric.called
+
+            list_resources()
+
+        success = add_metric.call_args_list[0].kwargs
+        assert success["name"] == "ServiceMethodSuccess"
+        assert success["value"] == 4
+        assert add_metric.call_args_list[1].kwargs["name"] == "ServiceMethodDuration"
+
+
+class TestMetricsSampleRateSetting:
+    """Test cases for the metrics sample rate setting"""
+
+    @pytest.mark.parametrize("env_var", ["POWERTOOLS_METRICS_SAMPLE_RATE", "LOG_METRICS_SAMPLE_RATE"])
+    def test_sample_rate_read_from_env(self, monkeypatch, env_var):
+        """Test that both documented environment variables set the sample rate"""
+        from config.settings import LoggingSettings
+
+        monkeypatch.setenv(env_var, "0.25")
+
+        assert LoggingSettings().metrics_sample_rate == 0.25
@@ -111,6 +111,18 @@ async def test_update_project(project_service, sample_project_config):
     assert updated_project.updated_at > updated_project.created_at
 
 
+@pytest.mark.asyncio
+async def test_update_project_without_changes(project_service, sample_project_config):
+    """Test that a no-op update leaves updated_at untouched"""
+    project = await project_service.create_project(sample_project_config)
+    
+    updates = ProjectUpdate(name=project.name)
+    
+    updated_project = await project_service.update_project(project.id, updates)
+    
+    assert updated_project.updated_at == updated_project.created_at
+
+
 @pytest.mark.asyncio
 async def test_update_nonexistent_project(project_service):
     """Test updating a non-existent project"""
@@ -200,4 +212,79 @@ async def test_remove_nonexistent_member(project_service, sample_project_config)
     project = await project_service.create_project(sample_project_config)
     
     with pytest.raises(ValueError, match="not a member"):
-        await project_service.remove_project_member(project.id, "user456")
\ No newline at end of file
+        await project_service.remove_project_member(project.id, "user456")
+
+
+@pytest.mark.asyncio
+async def test_list_projects_tracks_membership(project_service, sample_project_config):
+    """Test that listed projects follow member additions, removals and deletes"""
+    project = await project_service.create_project(sample_project_config)
+    
+    assert await project_service.list_projects("user456") == []
+    
+    await project_service.add_project_member(project.id, "user456", "developer")
+    assert [p.id for p in await project_service.list_projects("user456")] == [project.id]
+    
+    await project_service.remove_project_member(project.id, "user456")
+    assert await project_service.list_projects("user456") == []
+    
+    await project_service.delete_project(project.id)
+    assert await project_service.list_projects("user123") == []
+
+
+@pytest.mark.asyncio
+async def test_validate_project_access_bulk(project_service, sample_project_config):
+    """Test bulk access validation returns only accessible project IDs"""
+    project1 = await project_service.create_project(sample_project_config)
+    project2 = await project_service.create_project(sample_project_config)
+    await project_service.add_project_member(project2.id, "user456", "developer")
+    
+    requested = [project1.id, project2.id, "nonexistent-id"]
+    
+    assert await project_service.validate_project_access_bulk("user123", requested) == {
+        project1.id, project2.id
+    }
+    assert await project_service.validate_project_access_bulk("user456", requested) == {project2.id}
+    assert await project_service.validate_project_access_bulk("user789", requested) == set()
+
+
+@pytest.mark.asyncio
+async def test_list_projects_cached_until_mutation(project_service, sample_project_config):
+    """Test that list_projects results are reused until the store changes"""
+    await project_service.create_project(sample_project_config)
+    
+    first = await project_service.list_projects("user123")
+    
+    # A cache hit never reads the index, so hiding it does not change the result
+    user_index = project_service._user_index
+    project_service._user_index = {}
+    assert await project_service.list_projects("user123") == first
+    project_service._user_index = user_index
+    
+    await project_service.create_project(sample_project_config)
+    second = await project_service.list_projects("user123")
+    assert second != first
+    assert len(second) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_projects_result_mutation_does_not_leak(project_service, sample_project_config):
+    """Test that mutating a returned list does not affect later calls"""
+    project = await project_service.create_project(sample_project_config)
+    
+    projects = await project_service.list_projects("user123")
+    projects.clear()
+    
+    assert [p.id for p in await project_service.list_projects("user123")] == [project.id]
+
+
+@pytest.mark.asyncio
+async def test_list_projects_skips_project_deleted_mid_read(project_service, sample_project_config):
+    """Test that a project popped from the store before its index entry is skipped"""
+    project = await project_service.create_project(sample_project_config)
+    
+    # State a lock-free reader can observe while a delete is in progress
+    del project_service._projects[project.id]
+    project_service._version += 1
+    
+    assert await project_service.list_projects("user123") == []
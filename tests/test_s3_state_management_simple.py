@@ -83,6 +83,266 @@ def test_key_generation_methods():
         print(f"✗ Key generation test failed: {e}")
         return False
 
+def test_state_history_reads_index_without_head_requests():
+    """Test that history is served from the index object in a single GET"""
+    import asyncio
+    
+    with patch('src.services.s3_state_management.boto3') as mock_boto3:
+        mock_session = Mock()
+        mock_s3_client = Mock()
+        mock_boto3.Session.return_value = mock_session
+        mock_session.client.return_value = mock_s3_client
+        
+        index_body = (
+            b'{"key":"projects/p/history/20240101_000000_000000.json","version":"1.0.0",'
+            b'"timestamp":"2024-01-01T00:00:00","changeDescription":"first"}\n'
+            b'{"key":"projects/p/history/20240102_000000_000000.json","version":"1.1.0",'
+            b'"timestamp":"2024-01-02T00:00:00","changeDescription":"second"}\n'
+        )
+        mock_s3_client.get_object.return_value = {'Body': Mock(read=Mock(return_value=index_body))}
+        
+        from src.services.s3_state_management import S3StateManagementService
+        service = S3StateManagementService()
+        
+        history = asyncio.run(service.get_state_history("p", limit=1))
+        
+        assert [snapshot.change_description for snapshot in history] == ["second"]
+        assert history[0].version == "1.1.0"
+        assert history[0].s3_location == (
+            f"s3://{service.bucket_name}/projects/p/history/20240102_000000_000000.json"
+        )
+        mock_s3_client.get_object.assert_called_once_with(
+            Bucket=service.bucket_name, Key=f"{service.bucket_prefix}/p/history-index.jsonl"
+        )
+        mock_s3_client.head_object.assert_not_called()
+        mock_s3_client.list_objects_v2.assert_not_called()
+
+def test_current_state_revalidates_with_etag():
+    """Test that a 304 on the conditional GET returns the cached state"""
+    import asyncio
+    from botocore.exceptions import ClientError
+    
+    with patch('src.services.s3_state_management.boto3') as mock_boto3:
+        mock_session = Mock()
+        mock_s3_client = Mock()
+        mock_boto3.Session.return_value = mock_session
+        mock_session.client.return_value = mock_s3_client
+        
+        state_body = (
+            b'{"version":"1.0.0","projectId":"p","timestamp":"2024-01-01T00:00:00",'
+            b'"metadata":{"lastModifiedBy":"u","changeDescription":"c","changePlanId":null},'
+            b'"resources":[]}'
+        )
+        mock_s3_client.get_object.side_effect = [
+            {'Body': Mock(read=Mock(return_value=state_body)), 'ETag': '"abc"'},
+            ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject'),
+        ]
+        
+        from src.services.s3_state_management import S3StateManagementService
+        service = S3StateManagementService()
+        
+        first = asyncio.run(service.get_current_state("p"))
+        first.resources.append("mutated by caller")
+        second = asyncio.run(service.get_current_state("p"))
+        
+        assert second.project_id == "p"
+        assert second.resources == []
+        assert mock_s3_client.get_object.call_args.kwargs['IfNoneMatch'] == '"abc"'
+
+def test_current_state_cache_cleared_on_parse_error():
+    """Test that a state that fails to parse evicts the cached entry"""
+    import asyncio
+    import pytest
+    from src.models.exceptions import InfrastructureException
+    
+    with patch('src.services.s3_state_management.boto3') as mock_boto3:
+        mock_session = Mock()
+        mock_s3_client = Mock()
+        mock_boto3.Session.return_value = mock_session
+        mock_session.client.return_value = mock_s3_client
+        
+        state_body = (
+            b'{"version":"1.0.0","projectId":"p","timestamp":"2024-01-01T00:00:00",'
+            b'"metadata":{"lastModifiedBy":"u","changeDescription":"c","changePlanId":null},'
+            b'"resources":[]}'
+        )
+        mock_s3_client.get_object.side_effect = [
+            {'Body': Mock(read=Mock(return_value=state_body)), 'ETag': '"abc"'},
+            {'Body': Mock(read=Mock(return_value=b'{"version":')), 'ETag': '"def"'},
+            {'Body': Mock(read=Mock(return_value=state_body)), 'ETag': '"abc"'},
+        ]
+        
+        from src.services.s3_state_management import S3StateManagementService
+        service = S3StateManagementService()
+        
+        asyncio.run(service.get_current_state("p"))
+        with pytest.raises(InfrastructureException):
+            asyncio.run(service.get_current_state("p"))
+        asyncio.run(service.get_current_state("p"))
+        
+        assert 'IfNoneMatch' not in mock_s3_client.get_object.call_args.kwargs
+
+def test_validate_state_data_matches_deserialized_checks():
+    """Test that raw snapshot validation rejects what deserialization would"""
+    with patch('src.services.s3_state_management.boto3') as mock_boto3:
+        mock_boto3.Session.return_value = Mock()
+
+        from src.services.s3_state_management import S3StateManagementService
+        service = S3StateManagementService()
+
+        def state(**resource_overrides):
+            resource = {
+                "id": "i-1", "type": "EC2::Instance", "name": "web", "region": "us-east-1",
+                "properties": {}, "tags": {}, "status": "active",
+                "createdAt": "2024-01-01T00:00:00", "updatedAt": "2024-01-01T00:00:00",
+            }
+            resource.update(resource_overrides)
+            return {
+                "version": "1.0.0", "projectId": "p", "timestamp": "2024-01-01T00:00:00",
+                "metadata": {"lastModifiedBy": "u", "changeDescription": "c"},
+                "resources": [resource],
+            }
+
+        assert service._validate_state_data(state())
+        assert service._validate_state_structure(service._deserialize_state(state()))
+        assert not service._validate_state_data(state(name=""))
+        assert not service._validate_state_data(state(status="unknown"))
+
+        missing_tags = state()
+        del missing_tags["resources"][0]["tags"]
+        assert not service._validate_state_data(missing_tags)
+
+def test_history_index_keeps_legacy_snapshots_and_concurrent_entries():
+    """Test that the history index is backfilled and survives a concurrent write"""
+    import asyncio
+    from datetime import datetime
+    from moto import mock_aws
+    
+    with mock_aws():
+        from src.services.s3_state_management import S3StateManagementService
+        from src.models.data_models import InfrastructureState, StateMetadata
+        
+        service = S3StateManagementService()
+        service.s3_client.create_bucket(Bucket=service.bucket_name)
+        
+        # Snapshots and a current state written before the index existed
+        for day in (1, 2, 3):
+            timestamp = datetime(2024, 1, day)
+            service._put_json(
+                service._get_history_key("p", timestamp), b"{}",
+                {'version': f"1.{day}.0", 'change-description': f"legacy {day}"}
+            )
+        service._put_json(service._get_state_key("p"), b"{}", {
+            'version': "1.4.0", 'timestamp': datetime(2024, 1, 4).isoformat(),
+            'change-description': "current"
+        })
+        
+        def state(version):
+            return InfrastructureState(
+                project_id="p", version=version, timestamp=datetime(2024, 1, 5),
+                resources=[], metadata=StateMetadata(last_modified_by="u", change_description=version)
+            )
+        
+        asyncio.run(service.save_state("p", state("1.5.0")))
+        history = asyncio.run(service.get_state_history("p"))
+        assert [snapshot.version for snapshot in history] == ["1.4.0", "1.3.0", "1.2.0", "1.1.0"]
+        
+        # Another writer updates the index between our read and our write
+        index_key = service._get_history_index_key("p")
+        put_object = service.s3_client.put_object
+        
+        def racing_put_object(**kwargs):
+            if kwargs.get('Key') == index_key and not racing_put_object.raced:
+                racing_put_object.raced = True
+                body = service.s3_client.get_object(Bucket=service.bucket_name, Key=index_key)['Body'].read()
+                put_object(
+                    Bucket=service.bucket_name, Key=index_key,
+                    Body=body + b'{"key":"projects/p/history/other.json","version":"other",'
+                    b'"timestamp":"2024-01-05T00:00:00","changeDescription":"other"}\n'
+                )
+            return put_object(**kwargs)
+        racing_put_object.raced = False
+        
+        with patch.object(service.s3_client, 'put_object', side_effect=racing_put_object):
+            asyncio.run(service._append_history_index(
+                "p", "projects/p/history/new.json", "new", datetime(2024, 1, 6), "new"
+            ))
+        
+        history = asyncio.run(service.get_state_history("p", limit=2))
+        assert [snapshot.version for snapshot in history] == ["new", "other"]
+
+def test_history_index_is_capped():
+    """Test that the index keeps the newest entries and longer history falls back to listing"""
+    import asyncio
+    from datetime import datetime
+    from moto import mock_aws
+    
+    with mock_aws(), patch('src.services.s3_state_management._HISTORY_INDEX_LIMIT', 3):
+        from src.services.s3_state_management import S3StateManagementService
+        
+        service = S3StateManagementService()
+        service.s3_client.create_bucket(Bucket=service.bucket_name)
+        
+        for day in range(1, 6):
+            timestamp = datetime(2024, 1, day)
+            history_key = service._get_history_key("p", timestamp)
+            service._put_json(history_key, b"{}", {'version': f"1.{day}.0", 'change-description': "c"})
+            asyncio.run(service._append_history_index("p", history_key, f"1.{day}.0", timestamp, "c"))
+        
+        index = service.s3_client.get_object(
+            Bucket=service.bucket_name, Key=service._get_history_index_key("p")
+        )['Body'].read()
+        assert len(index.splitlines()) == 3
+        
+        with patch.object(service.s3_client, 'head_object', wraps=service.s3_client.head_object) as head_object:
+            recent = asyncio.run(service.get_state_history("p", limit=2))
+            assert not head_object.called
+        assert [snapshot.version for snapshot in recent] == ["1.5.0", "1.4.0"]
+        
+        history = asyncio.run(service.get_state_history("p"))
+        assert [snapshot.version for snapshot in history] == ["1.5.0", "1.4.0", "1.3.0", "1.2.0", "1.1.0"]
+
+def test_compare_states_orders_creates_before_updates_and_deletes():
+    """Test that creates come first, then updates and deletes in current order"""
+    from datetime import datetime
+    from src.models.data_models import InfrastructureState, Resource, StateMetadata
+    from src.models.enums import ChangeAction, ResourceStatus
+    
+    with patch('src.services.s3_state_management.boto3') as mock_boto3:
+        mock_boto3.Session.return_value = Mock()
+        
+        from src.services.s3_state_management import S3StateManagementService
+        service = S3StateManagementService()
+        
+        def resource(resource_id, instance_type="t3.micro"):
+            return Resource(
+                id=resource_id, project_id="p", type="EC2::Instance", name=resource_id,
+                region="us-east-1", properties={"instanceType": instance_type}, tags={},
+                status=ResourceStatus.ACTIVE, created_at=datetime(2024, 1, 1),
+                updated_at=datetime(2024, 1, 1)
+            )
+        
+        def state(resources):
+            return InfrastructureState(
+                project_id="p", version="1.0.0", timestamp=datetime(2024, 1, 1), resources=resources,
+                metadata=StateMetadata(last_modified_by="u", change_description="c")
+            )
+        
+        current = state([resource("a"), resource("b"), resource("c"), resource("d")])
+        desired = state([resource("d", "t3.large"), resource("e"), resource("b", "t3.large"), resource("f")])
+        
+        plan = service.compare_states(current, desired)
+        
+        assert [(c.action, c.resource_id) for c in plan.changes] == [
+            (ChangeAction.CREATE, "e"),
+            (ChangeAction.CREATE, "f"),
+            (ChangeAction.DELETE, "a"),
+            (ChangeAction.UPDATE, "b"),
+            (ChangeAction.DELETE, "c"),
+            (ChangeAction.UPDATE, "d"),
+        ]
+        assert (plan.summary.creates, plan.summary.updates, plan.summary.deletes) == (2, 2, 2)
+
 if __name__ == "__main__":
     print("Running S3 State Management Service validation tests...")
     
@@ -76,6 +76,18 @@ class TestServiceContainer:
         # Check that change plan engine has its dependencies
         change_plan_engine = container.get_service("change_plan_engine")
         assert change_plan_engine.state_service is container.get_service("state_service")
+    
+    def test_services_are_created_on_first_use(self):
+        """Test that only requested services and their dependencies are built"""
+        container = object.__new__(ServiceContainer)
+        container._initialize()
+        
+        assert container._services == {}
+        
+        engine = container.get_service("change_plan_engine")
+        
+        assert set(container._services) == {"state_service", "change_plan_engine"}
+        assert container.get_service("change_plan_engine") is engine
 
 
 class TestServiceAccessors:
@@ -317,4 +317,28 @@ class TestViewService:
         dashboard = await view_service.get_dashboard(sample_dashboard.id)
         assert len(dashboard.views) == 1
         assert sample_views[0].id not in dashboard.views
-        assert sample_views[1].id in dashboard.views
\ No newline at end of file
+        assert sample_views[1].id in dashboard.views
+    
+    @pytest.mark.asyncio
+    async def test_deleted_items_leave_project_listings(self, view_service, sample_views, sample_dashboard):
+        """Test that project listings stay in creation order and drop deleted items"""
+        await view_service.delete_view(sample_views[0].id)
+        await view_service.delete_dashboard(sample_dashboard.id)
+        
+        views = await view_service.get_views_by_project("project-123")
+        assert [view.id for view in views] == [sample_views[1].id]
+        assert await view_service.get_dashboards_by_project("project-123") == []
+    
+    @pytest.mark.asyncio
+    async def test_delete_view_after_dashboard_update(self, view_service, sample_views, sample_dashboard):
+        """Test that view removal follows dashboard membership changes"""
+        await view_service.update_dashboard(
+            dashboard_id=sample_dashboard.id,
+            name=sample_dashboard.name,
+            description=sample_dashboard.description,
+            view_ids=[sample_views[1].id, sample_views[2].id]
+        )
+        await view_service.delete_view(sample_views[2].id)
+        
+        dashboard = await view_service.get_dashboard(sample_dashboard.id)
+        assert dashboard.views == [sample_views[1].id]